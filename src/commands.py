@@ -4,8 +4,11 @@ Command handler module.
 Routes parsed intents to appropriate executor functions and manages help messages.
 """
 
+import sys
 from typing import Dict, Any, Optional, Tuple, Callable
 from . import executor
+from . import logging_util
+from .parser import Intent
 
 # Centralized help message with examples
 HELP_MESSAGE = """
@@ -53,7 +56,234 @@ Tips:
 • Use simple, clear names for files and folders
 """
 
-def handle(intent: Dict[str, Any], st, say: Callable[[str], None]) -> Optional[Tuple[str, Dict[str, Any]]]:
+# Listing markers and rule character; plain ASCII when stdout isn't UTF-8 (e.g. legacy
+# consoles), which avoids codec fallbacks and keeps output to one byte per character
+_MARK_DIR, _MARK_FILE, _RULE = (
+    ('📁 ', '📄 ', '─') if (sys.stdout.encoding or '').lower().startswith('utf') else ('[D] ', '[F] ', '-')
+)
+
+# Handler return type: optional (state_token, payload) for special states
+_Result = Optional[Tuple[str, Dict[str, Any]]]
+
+def _h_help(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    print(HELP_MESSAGE)
+    say("Showing available commands")
+    return None
+
+def _h_exit(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    say("Goodbye")
+    logging_util.flush()
+    return ("EXIT", {})
+
+def _h_list(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    files = executor.list_files(st)
+    out = ["\nContents:", _RULE * 40]
+    if not files:
+        out.append("(empty directory)")
+    else:
+        out.extend(f"{_MARK_DIR if is_dir else _MARK_FILE}{name}" for name, is_dir in files)
+    out.append(_RULE * 40)
+    sys.stdout.write("\n".join(out) + "\n")
+    say("Listed directory contents")
+    return None
+
+def _h_search(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    results = executor.search_files(st, intent.query)
+    out = [f"\nSearch results for '{intent.query}':", _RULE * 40]
+    if not results:
+        out.append("(no matches)")
+    else:
+        for p in results:
+            kind = _MARK_DIR if p.is_dir() else _MARK_FILE
+            try:
+                rel = p.relative_to(st.base)
+                out.append(f"{kind}{rel}")
+            except Exception:
+                out.append(f"{kind}{p.name}")
+    out.append(_RULE * 40)
+    sys.stdout.write("\n".join(out) + "\n")
+    say("Search completed")
+    return None
+
+def _h_mkdir(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    executor.mkdir(st, intent.name)
+    msg = f"Created folder '{intent.name}'"
+    print(msg)
+    say(msg)
+    return None
+
+def _h_mkfile(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    executor.mkfile(st, intent.name)
+    msg = f"Created file '{intent.name}'"
+    print(msg)
+    say(msg)
+    return None
+
+def _h_rename(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    msg = executor.rename_item(st, intent.old, intent.new)
+    print(msg)
+    say(msg)
+    return None
+
+def _h_copy(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    msg = executor.copy_item(st, intent.src, intent.dst)
+    print(msg)
+    say(msg)
+    return None
+
+def _h_move(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    msg = executor.move_item(st, intent.src, intent.dst)
+    print(msg)
+    say(msg)
+    return None
+
+def _h_read(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    msg, lines = executor.read_file(st, intent.name)
+    print(msg)
+    if lines:
+        print(_RULE * 40)
+        for ln in lines:
+            print(ln)
+        print(_RULE * 40)
+    say("File read")
+    return None
+
+def _h_append(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    msg = executor.append_file(st, intent.name, intent.text)
+    print(msg)
+    say(msg)
+    return None
+
+def _h_delete(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    # Return confirmation request
+    return ("AWAIT_CONFIRM_DELETE", {
+        "kind": intent.kind,
+        "name": intent.name
+    })
+
+def _h_cd(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    executor.cd(st, intent.path)
+    msg = f"Changed directory to '{intent.path}'"
+    print(msg)
+    say(msg)
+    return None
+
+def _h_pwd(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    cwd = executor.pwd(st)
+    print(f"\nCurrent directory: {cwd}")
+    say("Showing current directory")
+    return None
+
+def _h_history(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    entries = executor.read_history(10 if intent.count is None else intent.count)
+    print("\nRecent history:")
+    print(_RULE * 60)
+    if not entries:
+        print("(no history yet)")
+    else:
+        for row in entries:
+            print(f"{row['timestamp']} | {row['intent_type']}: {row['text']} -> {row['outcome']}")
+    print(_RULE * 60)
+    say("Showing recent history")
+    return None
+
+def _h_recents(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    files = executor.recent_files(st, 10 if intent.count is None else intent.count)
+    out = ["\nRecent files:", _RULE * 60]
+    if not files:
+        out.append("(none)")
+    else:
+        for p in files:
+            try:
+                rel = p.relative_to(st.base)
+                out.append(f"{rel}  (modified)")
+            except Exception:
+                out.append(f"{p.name}")
+    out.append(_RULE * 60)
+    sys.stdout.write("\n".join(out) + "\n")
+    say("Showing recent files")
+    return None
+
+def _h_clear_history(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    msg = executor.clear_history()
+    print(msg)
+    say(msg)
+    return None
+
+def _h_stats(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    s = executor.stats(st)
+    print(f"\nStats: files={s['files']}, folders={s['folders']}, total={s['total']}")
+    say("Showing directory stats")
+    return None
+
+def _h_size(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    msg = executor.item_size(st, intent.name)
+    print(msg)
+    say(msg)
+    return None
+
+def _h_tree(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    lines = executor.dir_tree(st, 2 if intent.depth is None else intent.depth)
+    out = ["\nDirectory tree:", _RULE * 40, *lines, _RULE * 40]
+    sys.stdout.write("\n".join(out) + "\n")
+    say("Tree view shown")
+    return None
+
+def _h_touch(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    msg = executor.touch_file(st, intent.name)
+    print(msg)
+    say(msg)
+    return None
+
+def _h_open_file(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    msg = executor.open_file(st, intent.name)
+    print(msg)
+    say(msg)
+    return None
+
+def _h_open_app(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    executor.open_app(intent.app)
+    msg = f"Opened {intent.app}"
+    print(msg)
+    say(msg)
+    return None
+
+def _h_unknown(intent: Intent, st, say: Callable[[str], None]) -> _Result:
+    print("\nI didn't understand that command.")
+    print("Say 'help' to see available commands.")
+    say("Command not recognized. Try asking for help.")
+    return None
+
+# Intent type -> handler jump table; unmatched types fall back to _h_unknown
+_HANDLERS: Dict[str, Callable[..., _Result]] = {
+    "HELP": _h_help,
+    "EXIT": _h_exit,
+    "LIST": _h_list,
+    "SEARCH": _h_search,
+    "MKDIR": _h_mkdir,
+    "MKFILE": _h_mkfile,
+    "RENAME": _h_rename,
+    "COPY": _h_copy,
+    "MOVE": _h_move,
+    "READ": _h_read,
+    "APPEND": _h_append,
+    "DELETE": _h_delete,
+    "CD": _h_cd,
+    "PWD": _h_pwd,
+    "HISTORY": _h_history,
+    "RECENTS": _h_recents,
+    "CLEAR_HISTORY": _h_clear_history,
+    "STATS": _h_stats,
+    "SIZE": _h_size,
+    "TREE": _h_tree,
+    "TOUCH": _h_touch,
+    "OPEN_FILE": _h_open_file,
+    "OPEN_APP": _h_open_app,
+}
+# Bound once at import so handle() does a single C-level call per dispatch
+_dispatch = _HANDLERS.get
+
+def handle(intent: Intent, st, say: Callable[[str], None]) -> _Result:
     """
     Handle a parsed command intent.
     
@@ -66,197 +296,8 @@ def handle(intent: Dict[str, Any], st, say: Callable[[str], None]) -> Optional[T
         Optional tuple of (state_token, payload) for special states
     """
     try:
-        if intent["type"] == "HELP":
-            print(HELP_MESSAGE)
-            say("Showing available commands")
-            return None
-
-        elif intent["type"] == "EXIT":
-            say("Goodbye")
-            return ("EXIT", {})
-
-        elif intent["type"] == "LIST":
-            files = executor.list_files(st)
-            print("\nContents:")
-            print("─" * 40)
-            if not files:
-                print("(empty directory)")
-            else:
-                for f in files:
-                    print(f"{'📁 ' if f.is_dir() else '📄 '}{f.name}")
-            print("─" * 40)
-            say("Listed directory contents")
-            return None
-
-        elif intent["type"] == "SEARCH":
-            results = executor.search_files(st, intent["query"])
-            print(f"\nSearch results for '{intent['query']}':")
-            print("─" * 40)
-            if not results:
-                print("(no matches)")
-            else:
-                for p in results:
-                    kind = '📁 ' if p.is_dir() else '📄 '
-                    try:
-                        rel = p.relative_to(st.base)
-                        print(f"{kind}{rel}")
-                    except Exception:
-                        print(f"{kind}{p.name}")
-            print("─" * 40)
-            say("Search completed")
-            return None
-
-        elif intent["type"] == "MKDIR":
-            executor.mkdir(st, intent["name"])
-            msg = f"Created folder '{intent['name']}'"
-            print(msg)
-            say(msg)
-            return None
-
-        elif intent["type"] == "MKFILE":
-            executor.mkfile(st, intent["name"])
-            msg = f"Created file '{intent['name']}'"
-            print(msg)
-            say(msg)
-            return None
-
-        elif intent["type"] == "RENAME":
-            msg = executor.rename_item(st, intent["old"], intent["new"])
-            print(msg)
-            say(msg)
-            return None
-
-        elif intent["type"] == "COPY":
-            msg = executor.copy_item(st, intent["src"], intent["dst"])
-            print(msg)
-            say(msg)
-            return None
-
-        elif intent["type"] == "MOVE":
-            msg = executor.move_item(st, intent["src"], intent["dst"])
-            print(msg)
-            say(msg)
-            return None
-
-        elif intent["type"] == "READ":
-            msg, lines = executor.read_file(st, intent["name"])
-            print(msg)
-            if lines:
-                print("─" * 40)
-                for ln in lines:
-                    print(ln)
-                print("─" * 40)
-            say("File read")
-            return None
-
-        elif intent["type"] == "APPEND":
-            msg = executor.append_file(st, intent["name"], intent["text"])
-            print(msg)
-            say(msg)
-            return None
-
-        elif intent["type"] == "DELETE":
-            # Return confirmation request
-            return ("AWAIT_CONFIRM_DELETE", {
-                "kind": intent["kind"],
-                "name": intent["name"]
-            })
-
-        elif intent["type"] == "CD":
-            executor.cd(st, intent["path"])
-            msg = f"Changed directory to '{intent['path']}'"
-            print(msg)
-            say(msg)
-            return None
-
-        elif intent["type"] == "PWD":
-            cwd = executor.pwd(st)
-            print(f"\nCurrent directory: {cwd}")
-            say("Showing current directory")
-            return None
-
-        elif intent["type"] == "HISTORY":
-            entries = executor.read_history(intent.get("count", 10))
-            print("\nRecent history:")
-            print("─" * 60)
-            if not entries:
-                print("(no history yet)")
-            else:
-                for row in entries:
-                    print(f"{row['timestamp']} | {row['intent_type']}: {row['text']} -> {row['outcome']}")
-            print("─" * 60)
-            say("Showing recent history")
-            return None
-
-        elif intent["type"] == "RECENTS":
-            files = executor.recent_files(st, intent.get("count", 10))
-            print("\nRecent files:")
-            print("─" * 60)
-            if not files:
-                print("(none)")
-            else:
-                for p in files:
-                    try:
-                        rel = p.relative_to(st.base)
-                        print(f"{rel}  (modified)")
-                    except Exception:
-                        print(f"{p.name}")
-            print("─" * 60)
-            say("Showing recent files")
-            return None
-
-        elif intent["type"] == "CLEAR_HISTORY":
-            msg = executor.clear_history()
-            print(msg)
-            say(msg)
-            return None
-
-        elif intent["type"] == "STATS":
-            s = executor.stats(st)
-            print(f"\nStats: files={s['files']}, folders={s['folders']}, total={s['total']}")
-            say("Showing directory stats")
-            return None
-
-        elif intent["type"] == "SIZE":
-            msg = executor.item_size(st, intent["name"])
-            print(msg)
-            say(msg)
-            return None
-
-        elif intent["type"] == "TREE":
-            lines = executor.dir_tree(st, intent.get("depth", 2))
-            print("\nDirectory tree:")
-            print("─" * 40)
-            for ln in lines:
-                print(ln)
-            print("─" * 40)
-            say("Tree view shown")
-            return None
-
-        elif intent["type"] == "TOUCH":
-            msg = executor.touch_file(st, intent["name"])
-            print(msg)
-            say(msg)
-            return None
-
-        elif intent["type"] == "OPEN_FILE":
-            msg = executor.open_file(st, intent["name"])
-            print(msg)
-            say(msg)
-            return None
-
-        elif intent["type"] == "OPEN_APP":
-            executor.open_app(intent["app"])
-            msg = f"Opened {intent['app']}"
-            print(msg)
-            say(msg)
-            return None
-
-        else:  # UNKNOWN
-            print("\nI didn't understand that command.")
-            print("Say 'help' to see available commands.")
-            say("Command not recognized. Try asking for help.")
-            return None
+        fn = _dispatch(intent.type, _h_unknown)
+        return fn(intent, st, say)
 
     except Exception as e:
         error_msg = f"Error: {str(e)}"
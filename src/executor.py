@@ -8,11 +8,20 @@ file/directory operations and launching whitelisted applications.
 
 import os
 import re
+import csv
+import heapq
+import io
+import itertools
+import mmap
 import platform
 import subprocess
+from collections import deque
 from pathlib import Path
 import shutil
-from typing import Dict, List, Optional, Tuple
+import stat
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+from . import logging_util
 
 # OS-specific whitelisted applications
 ALLOWED_APPS = {
@@ -27,18 +36,88 @@ ALLOWED_APPS = {
     }
 }
 
-def list_files(state) -> List[Path]:
+# Platform is fixed for the life of the process; resolve it and its whitelist once
+_IS_WINDOWS = platform.system() == 'Windows'
+_OS_KEY = 'Windows' if _IS_WINDOWS else 'Linux'
+_APPS = ALLOWED_APPS.get(_OS_KEY, {})
+
+# Column layout of logs.csv and the block size used when tailing it
+_HISTORY_FIELDS = ['timestamp', 'text', 'intent_type', 'outcome']
+_TAIL_BLOCK_SIZE = 4096
+
+# Maximum number of bytes read_file loads from the start of a file
+_READ_LIMIT = 256 * 1024
+
+# Connectors used by dir_tree
+_TREE_MID = '├─ '
+_TREE_LAST = '└─ '
+
+# Spoken punctuation -> path characters, applied in one pass by open_file
+_SPOKEN_MAP = {
+    'dot': '.',
+    'period': '.',
+    'underscore': '_',
+    'dash': '-',
+    'slash': '/',
+    'backslash': '\\',
+}
+_SPOKEN_RE = re.compile(r'\b(' + '|'.join(_SPOKEN_MAP) + r')\b')
+
+# "base ext" -> "base.ext" heuristic for common extensions
+_EXT_HINT_RE = re.compile(r"^(?P<base>[\w\-. /\\]+)\s+(?P<ext>txt|pdf|docx|xlsx|csv|md|png|jpg|jpeg)$")
+
+def _walk(root) -> Iterator[os.DirEntry]:
+    """
+    Yield every entry below root using os.scandir.
+
+    DirEntry caches the file type from the directory read, so is_file()/is_dir()
+    checks during the walk avoid the extra stat() call a Path would make.
+    Symlinked directories are not descended into; unreadable ones are skipped.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    yield e
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+        except OSError:
+            continue
+
+def _under(path_str: str, base_str: str) -> bool:
+    """
+    Sandbox test for an already-canonical path: a plain string prefix check,
+    with no Path objects or filesystem access.
+    """
+    return path_str == base_str or path_str.startswith(base_str + os.sep)
+
+def _symlink_escapes(entry: os.DirEntry, base_str: str) -> bool:
+    """Return True if a symlinked entry points outside base_str (plain entries never do)."""
+    if not entry.is_symlink():
+        return False
+    return not _under(os.path.realpath(entry.path), base_str)
+
+def _resolve(state, name: str) -> Optional[Path]:
+    """Sandbox-checked resolution of name in the current directory (None if outside)."""
+    try:
+        return Path(state.resolve_in_cwd_str(name))
+    except ValueError:
+        return None
+
+def list_files(state) -> List[Tuple[str, bool]]:
     """
     Return files and directories in the current working directory.
     
     Args:
         state: ShellState instance tracking current directory
     Returns:
-        Sorted list of Path entries in current directory
+        Sorted list of (name, is_dir) tuples for entries in current directory
     """
     try:
-        entries = sorted(state.current_directory.iterdir())
-        return entries
+        with os.scandir(state.current_directory) as it:
+            return sorted((e.name, e.is_dir()) for e in it)
     except Exception:
         return []
 
@@ -52,10 +131,10 @@ def mkdir(state, name: str) -> None:
     """
     try:
         # Resolve path relative to current directory
-        new_dir = state.resolve_in_cwd(name)
+        new_dir = _resolve(state, name)
         
         # Safety check
-        if not state.inside_sandbox(new_dir):
+        if new_dir is None:
             print("Error: Cannot create directory outside sandbox")
             return
             
@@ -80,10 +159,10 @@ def mkfile(state, name: str) -> None:
     """
     try:
         # Resolve path relative to current directory
-        new_file = state.resolve_in_cwd(name)
+        new_file = _resolve(state, name)
         
         # Safety check
-        if not state.inside_sandbox(new_file):
+        if new_file is None:
             print("Error: Cannot create file outside sandbox")
             return
             
@@ -109,10 +188,10 @@ def delete(state, kind: str, name: str) -> None:
     """
     try:
         # Resolve path relative to current directory
-        target = state.resolve_in_cwd(name)
+        target = _resolve(state, name)
         
         # Safety check
-        if not state.inside_sandbox(target):
+        if target is None:
             print("Error: Cannot delete items outside sandbox")
             return
             
@@ -153,10 +232,10 @@ def cd(state, path: str) -> None:
                 return
                 
         # Resolve target path
-        target = state.resolve_in_cwd(path)
+        target = _resolve(state, path)
         
         # Safety checks
-        if not state.inside_sandbox(target):
+        if target is None:
             print("Error: Cannot change to directory outside sandbox")
             return
             
@@ -198,18 +277,14 @@ def open_app(app: str) -> None:
         app: Name of application to open
     """
     try:
-        # Get OS-specific application whitelist
-        os_name = 'Windows' if platform.system() == 'Windows' else 'Linux'
-        allowed = ALLOWED_APPS.get(os_name, {})
-        
         # Check if app is whitelisted
-        if app not in allowed:
+        if app not in _APPS:
             print(f"Error: Application '{app}' is not allowed")
             return
             
         # Launch application
         subprocess.Popen(
-            allowed[app],
+            _APPS[app],
             shell=True,  # Required for some Windows apps
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL
@@ -221,30 +296,74 @@ def open_app(app: str) -> None:
     except Exception as e:
         print(f"Error opening application: {str(e)}")
 
+def _fast_copyfile(src, dst) -> None:
+    """
+    Copy file contents with os.copy_file_range where available, letting the kernel
+    copy (or reflink) without a userspace buffer; falls back to shutil.copyfile.
+    """
+    if not hasattr(os, 'copy_file_range'):
+        shutil.copyfile(src, dst)
+        return
+    # shutil.copyfile refuses FIFOs and devices (open() on a FIFO blocks until a
+    # writer shows up), so anything but regular files goes to it for that error
+    src_st = os.stat(src)
+    try:
+        dst_st = os.stat(dst)
+    except FileNotFoundError:
+        dst_st = None
+    if not stat.S_ISREG(src_st.st_mode) or (dst_st is not None and stat.S_ISFIFO(dst_st.st_mode)):
+        shutil.copyfile(src, dst)
+        return
+    # Opening dst for writing would truncate src if both name the same file
+    if dst_st is not None and os.path.samestat(src_st, dst_st):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if n == 0:
+                    # Some filesystem/kernel combinations report 0 before the end;
+                    # redo the copy the portable way rather than leave dst short
+                    break
+                remaining -= n
+        if remaining > 0:
+            shutil.copyfile(src, dst)
+    except OSError:
+        # e.g. cross-device copy on older kernels, or unsupported filesystem
+        shutil.copyfile(src, dst)
+
+def _fast_copy2(src, dst) -> None:
+    """Drop-in for shutil.copy2 built on _fast_copyfile."""
+    _fast_copyfile(src, dst)
+    shutil.copystat(src, dst)
+
 def copy_item(state, src_name: str, dst_name: str) -> str:
     """
     Copy a file or folder within the sandbox.
     """
     try:
-        src = state.resolve_in_cwd(src_name)
-        dst = state.resolve_in_cwd(dst_name)
+        src = _resolve(state, src_name)
+        dst = _resolve(state, dst_name)
+        # Safety checks
+        if src is None or dst is None:
+            return "Error: Operation outside sandbox"
         # If dst is a directory, copy inside it
         if dst.exists() and dst.is_dir():
             dst = dst / src.name
-        # Safety checks
-        if not state.inside_sandbox(src) or not state.inside_sandbox(dst):
-            return "Error: Operation outside sandbox"
+            if not _under(os.path.realpath(dst), str(state.base)):
+                return "Error: Operation outside sandbox"
         if not src.exists():
             return f"Error: '{src_name}' not found"
         if src.is_dir():
             if dst.exists():
                 return f"Error: '{dst.name}' already exists"
-            shutil.copytree(src, dst)
+            shutil.copytree(src, dst, copy_function=_fast_copy2)
             return f"Copied folder '{src.name}' to '{dst.name}'"
         else:
             if dst.is_dir():
                 dst = dst / src.name
-            shutil.copy2(src, dst)
+            _fast_copy2(src, dst)
             return f"Copied file '{src.name}' to '{dst.name}'"
     except Exception as e:
         return f"Error: {str(e)}"
@@ -254,12 +373,14 @@ def move_item(state, src_name: str, dst_name: str) -> str:
     Move (rename) a file or folder within the sandbox.
     """
     try:
-        src = state.resolve_in_cwd(src_name)
-        dst = state.resolve_in_cwd(dst_name)
+        src = _resolve(state, src_name)
+        dst = _resolve(state, dst_name)
+        if src is None or dst is None:
+            return "Error: Operation outside sandbox"
         if dst.exists() and dst.is_dir():
             dst = dst / src.name
-        if not state.inside_sandbox(src) or not state.inside_sandbox(dst):
-            return "Error: Operation outside sandbox"
+            if not _under(os.path.realpath(dst), str(state.base)):
+                return "Error: Operation outside sandbox"
         if not src.exists():
             return f"Error: '{src_name}' not found"
         if dst.exists():
@@ -274,17 +395,20 @@ def read_file(state, name: str, max_lines: int = 100) -> Tuple[str, List[str]]:
     Read a text file and return up to max_lines and an outcome.
     """
     try:
-        path = state.resolve_in_cwd(name)
-        if not state.inside_sandbox(path):
+        path = _resolve(state, name)
+        if path is None:
             return ("Error: Outside sandbox", [])
         if not path.is_file():
             return (f"Error: '{name}' is not a file", [])
-        lines: List[str] = []
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            for i, line in enumerate(f):
-                if i >= max_lines:
-                    break
-                lines.append(line.rstrip('\n'))
+        # Bounded read: only the head of the file is ever loaded, however large it is
+        with open(path, 'rb') as f:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            data = f.read(_READ_LIMIT)
+        # Split on line endings only, as text-mode iteration did; splitlines()
+        # would also break on form feeds, \x1c-\x1e, \x85 and \u2028/\u2029
+        text = io.StringIO(data.decode('utf-8', errors='ignore'), newline=None)
+        lines = [line.rstrip('\n') for line in itertools.islice(text, max_lines)]
         return (f"Read {len(lines)} lines from '{path.name}'", lines)
     except Exception as e:
         return (f"Error: {str(e)}", [])
@@ -294,8 +418,8 @@ def append_file(state, name: str, text: str) -> str:
     Append text to a file, creating it if it doesn't exist.
     """
     try:
-        path = state.resolve_in_cwd(name)
-        if not state.inside_sandbox(path):
+        path = _resolve(state, name)
+        if path is None:
             return "Error: Outside sandbox"
         with open(path, 'a', encoding='utf-8') as f:
             f.write(text + "\n")
@@ -303,6 +427,19 @@ def append_file(state, name: str, text: str) -> str:
     except Exception as e:
         return f"Error: {str(e)}"
 
+def _file_contains(path: str, pattern: "re.Pattern[bytes]") -> bool:
+    """
+    Check a file for a byte pattern via mmap, without decoding it.
+    Lets grep_files reject non-matching files before the per-line text pass.
+    """
+    with open(path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return pattern.search(mm) is not None
+        except ValueError:
+            # Empty files cannot be mapped and contain nothing
+            return False
+
 def grep_files(state, query: str) -> List[Tuple[Path, int, str]]:
     """
     Search for query substring in text files under current directory.
@@ -311,14 +448,20 @@ def grep_files(state, query: str) -> List[Tuple[Path, int, str]]:
     q = query.lower().strip()
     results: List[Tuple[Path, int, str]] = []
     try:
-        for p in state.current_directory.rglob('*'):
-            if p.is_file():
+        if not _under(str(state.current_directory), str(state.base)):
+            return []
+        # Byte-level prefilter; ASCII case folding on bytes is only valid for ASCII queries
+        q_bytes = re.compile(re.escape(q.encode()), re.IGNORECASE) if q.isascii() else None
+        # Regular files only: symlinks are skipped so no content outside the sandbox is read
+        for e in _walk(state.current_directory):
+            if e.is_file(follow_symlinks=False):
                 try:
-                    with open(p, 'r', encoding='utf-8', errors='ignore') as f:
+                    if q_bytes is not None and not _file_contains(e.path, q_bytes):
+                        continue
+                    with open(e.path, 'r', encoding='utf-8', errors='ignore') as f:
                         for i, line in enumerate(f, start=1):
                             if q in line.lower():
-                                if state.inside_sandbox(p):
-                                    results.append((p, i, line.strip()))
+                                results.append((Path(e.path), i, line.strip()))
                 except Exception:
                     continue
         return results[:500]  # cap results for speed
@@ -326,18 +469,21 @@ def grep_files(state, query: str) -> List[Tuple[Path, int, str]]:
         return []
 
 def _dir_size(path: Path) -> int:
-    total = 0
     try:
-        if path.is_file():
-            return path.stat().st_size
-        for p in path.rglob('*'):
-            try:
-                if p.is_file():
-                    total += p.stat().st_size
-            except Exception:
-                continue
+        st = path.stat()
     except Exception:
-        return total
+        return 0
+    if not stat.S_ISDIR(st.st_mode):
+        return st.st_size
+    # No cache across commands: a file below the top level can grow (say, in an
+    # editor started by "open file") without touching any directory's mtime
+    total = 0
+    for e in _walk(path):
+        try:
+            if e.is_file():
+                total += e.stat().st_size
+        except Exception:
+            continue
     return total
 
 def _fmt_size(bytes_count: int) -> str:
@@ -351,8 +497,8 @@ def _fmt_size(bytes_count: int) -> str:
 
 def item_size(state, name: str) -> str:
     try:
-        path = state.resolve_in_cwd(name)
-        if not state.inside_sandbox(path):
+        path = _resolve(state, name)
+        if path is None:
             return "Error: Outside sandbox"
         if not path.exists():
             return f"Error: '{name}' not found"
@@ -368,24 +514,37 @@ def dir_tree(state, depth: int = 2) -> List[str]:
     base = state.current_directory
     lines: List[str] = [f"{base.name}/"]
     try:
-        def walk(dir_path: Path, level: int):
-            if level > depth:
-                return
-            entries = sorted(dir_path.iterdir())
-            for e in entries:
-                prefix = '  ' * level + ('├─ ' if e != entries[-1] else '└─ ')
-                lines.append(prefix + (e.name + ('/' if e.is_dir() else '')))
-                if e.is_dir():
-                    walk(e, level + 1)
-        walk(base, 1)
+        # Explicit stack of (entries iterator, last index, indent) frames instead of
+        # recursion; a deque used as a stack keeps the depth-first line order
+        stack: Deque[Tuple[Iterator[Tuple[int, os.DirEntry]], int, str]] = deque()
+
+        def push(dir_path: str, level: int) -> None:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+            stack.append((enumerate(entries), len(entries) - 1, '  ' * level))
+
+        if depth >= 1:
+            push(os.fspath(base), 1)
+        while stack:
+            entries, last, indent = stack[-1]
+            item = next(entries, None)
+            if item is None:
+                stack.pop()
+                continue
+            i, e = item
+            is_dir = e.is_dir()
+            lines.append(indent + (_TREE_MID if i != last else _TREE_LAST) + e.name + ('/' if is_dir else ''))
+            # Don't descend through symlinked directories
+            if is_dir and not e.is_symlink() and len(stack) < depth:
+                push(e.path, len(stack) + 1)
         return lines
     except Exception:
         return lines
 
 def touch_file(state, name: str) -> str:
     try:
-        path = state.resolve_in_cwd(name)
-        if not state.inside_sandbox(path):
+        path = _resolve(state, name)
+        if path is None:
             return "Error: Outside sandbox"
         path.touch(exist_ok=True)
         return f"Touched '{path.name}'"
@@ -393,10 +552,10 @@ def touch_file(state, name: str) -> str:
         return f"Error: {str(e)}"
 
 def clear_history() -> str:
-    from pathlib import Path
-    import csv
     log_file = Path('logs.csv')
     try:
+        # Write out pending events first so they don't reappear after the reset
+        logging_util.flush()
         with open(log_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(['timestamp', 'text', 'intent_type', 'outcome'])
@@ -406,42 +565,38 @@ def clear_history() -> str:
 
 def recent_files(state, count: int = 10) -> List[Path]:
     try:
-        files = [p for p in state.current_directory.rglob('*') if p.is_file()]
-        files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        return files[:count]
+        entries = ((e.stat().st_mtime, e.path) for e in _walk(state.current_directory)
+                   if e.is_file(follow_symlinks=False))
+        # Bounded heap: O(N log count) and only `count` items held in memory
+        top = heapq.nlargest(count, entries)
+        return [Path(p) for _, p in top]
     except Exception:
         return []
 
 def stats(state) -> Dict[str, int]:
     try:
-        entries = list(state.current_directory.iterdir())
-        return {
-            'files': sum(1 for e in entries if e.is_file()),
-            'folders': sum(1 for e in entries if e.is_dir()),
-            'total': len(entries)
-        }
+        files = folders = total = 0
+        with os.scandir(state.current_directory) as it:
+            for e in it:
+                total += 1
+                if e.is_file():
+                    files += 1
+                elif e.is_dir():
+                    folders += 1
+        return {'files': files, 'folders': folders, 'total': total}
     except Exception:
         return {'files': 0, 'folders': 0, 'total': 0}
 
 def open_file(state, name: str) -> str:
     try:
         # Normalize spoken punctuation to path characters
-        def _normalize_spoken_path(s: str) -> str:
-            s = re.sub(r'\bdot\b', '.', s)
-            s = re.sub(r'\bperiod\b', '.', s)
-            s = re.sub(r'\bunderscore\b', '_', s)
-            s = re.sub(r'\bdash\b', '-', s)
-            s = re.sub(r'\bslash\b', '/', s)
-            s = re.sub(r'\bbackslash\b', r'\\', s)
-            return s
-
-        normalized = _normalize_spoken_path(name).strip()
+        normalized = _SPOKEN_RE.sub(lambda m: _SPOKEN_MAP[m.group(1)], name).strip()
         # Build candidate names to try
         candidates = [name.strip()]
         if normalized != candidates[0]:
             candidates.append(normalized)
         # Heuristic: convert "base ext" -> "base.ext" for common extensions
-        m = re.match(r"^(?P<base>[\w\-. /\\]+)\s+(?P<ext>txt|pdf|docx|xlsx|csv|md|png|jpg|jpeg)$", normalized)
+        m = _EXT_HINT_RE.match(normalized)
         if m:
             candidates.append(f"{m.group('base').strip()}.{m.group('ext').strip()}")
 
@@ -449,17 +604,15 @@ def open_file(state, name: str) -> str:
         path = None
         for cand in candidates:
             try:
-                p = state.resolve_in_cwd(cand)
-                if state.inside_sandbox(p) and p.exists():
+                p = _resolve(state, cand)
+                if p is not None and p.exists():
                     path = p
                     break
             except Exception:
                 continue
         if path is None:
             return f"Error: '{normalized}' not found"
-        if not state.inside_sandbox(path):
-            return "Error: Outside sandbox"
-        if platform.system() == 'Windows':
+        if _IS_WINDOWS:
             os.startfile(str(path))  # type: ignore
         else:
             subprocess.Popen(['xdg-open', str(path)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
@@ -479,13 +632,15 @@ def search_files(state, query: str) -> List[Path]:
     """
     q = query.lower().strip()
     try:
+        base_str = str(state.base)
+        if not _under(str(state.current_directory), base_str):
+            return []
         matches: List[Path] = []
-        for p in state.current_directory.rglob('*'):
+        for e in _walk(state.current_directory):
             try:
-                if q in p.name.lower():
-                    # Ensure still inside sandbox
-                    if state.inside_sandbox(p):
-                        matches.append(p)
+                # The walk never follows symlinks, so only symlinked entries need a check
+                if q in e.name.lower() and not _symlink_escapes(e, base_str):
+                    matches.append(Path(e.path))
             except Exception:
                 continue
         return sorted(matches)
@@ -504,13 +659,13 @@ def rename_item(state, old: str, new: str) -> str:
         Outcome message string
     """
     try:
-        src = state.resolve_in_cwd(old)
-        if not state.inside_sandbox(src):
+        src = _resolve(state, old)
+        if src is None:
             return "Error: Cannot rename items outside sandbox"
         if not src.exists():
             return f"Error: '{old}' not found"
         dst = src.parent / new
-        if not state.inside_sandbox(dst):
+        if not _under(os.path.realpath(dst), str(state.base)):
             return "Error: Target path outside sandbox"
         if dst.exists():
             return f"Error: '{new}' already exists"
@@ -520,6 +675,46 @@ def rename_item(state, old: str, new: str) -> str:
     except Exception as e:
         return f"Error: {str(e)}"
 
+def _record_starts(data: bytes) -> List[int]:
+    """
+    Offsets in data, a tail of a CSV file, at which a record begins.
+
+    A newline ends a record only outside quotes. Each escaped quote inside a
+    field is doubled, so a newline is outside quotes exactly when an even number
+    of quote characters follow it to the end of the file. Both bytes are ASCII,
+    so the test works on the raw UTF-8 bytes.
+    """
+    quotes_after = data.count(b'"')
+    starts = []
+    for m in re.finditer(b'["\n]', data):
+        if m.group() == b'"':
+            quotes_after -= 1
+        elif quotes_after % 2 == 0:
+            starts.append(m.end())
+    return starts
+
+def _tail_records(path: Path, count: int) -> List[List[str]]:
+    """
+    Return at least the last count records of a CSV file (all of them if it is
+    shorter), reading backwards from the end in fixed-size blocks so the cost
+    does not grow with the file size.
+    """
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b''
+        starts: List[int] = []
+        # The window holds len(starts) - 1 complete records after its first boundary
+        while pos > 0 and len(starts) <= count:
+            step = min(_TAIL_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+            starts = _record_starts(data)
+    if pos > 0:
+        data = data[starts[0]:]  # drop the partial record the window began inside
+    text = data.decode('utf-8', errors='ignore')
+    return list(csv.reader(io.StringIO(text, newline='')))
+
 def read_history(count: int) -> List[dict]:
     """
     Read recent command history entries from logs.csv.
@@ -529,23 +724,20 @@ def read_history(count: int) -> List[dict]:
     Returns:
         List of dict entries with keys timestamp, text, intent_type, outcome
     """
-    from pathlib import Path
-    import csv
-    log_file = Path('logs.csv')
-    if not log_file.exists():
+    if count <= 0:
         return []
-    rows: List[dict] = []
+    log_file = Path('logs.csv')
     try:
-        with open(log_file, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            data = list(reader)
-            for row in data[-count:]:
-                rows.append({
-                    'timestamp': row.get('timestamp', ''),
-                    'text': row.get('text', ''),
-                    'intent_type': row.get('intent_type', ''),
-                    'outcome': row.get('outcome', '')
-                })
-        return rows
+        # Buffered events must reach the file before it is tailed
+        logging_util.flush()
+        if not log_file.exists():
+            return []
+        rows: List[dict] = []
+        for fields in _tail_records(log_file, count):
+            if not fields or fields == _HISTORY_FIELDS:
+                continue
+            fields += [''] * (len(_HISTORY_FIELDS) - len(fields))
+            rows.append(dict(zip(_HISTORY_FIELDS, fields)))
+        return rows[-count:]
     except Exception:
-        return []
\ No newline at end of file
+        return []
@@ -1,13 +1,76 @@
 """
 Logging utility for voice shell interactions.
 Logs commands and their outcomes to a CSV file.
+
+Events are queued by log_event and appended to the file by a background
+writer thread, so callers never wait on disk I/O; flush() blocks until
+everything queued so far is written and also runs at interpreter exit.
 """
 
+import atexit
 import csv
-import os
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+# Rows waiting for the writer thread; a threading.Event in the queue is a flush
+# request, set once every row queued before it has been written
+_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+# Set once the header has been checked, so later writes skip straight to appending
+_HEADER_WRITTEN = False
+
+def _write_rows(rows: List[List[str]]) -> None:
+    """Append rows to the CSV file, writing the header first if the file is new."""
+    global _HEADER_WRITTEN
+    log_file = Path("logs.csv")
+    # errors='replace' so text that cannot be encoded (lone surrogates from a
+    # decoded filename, say) is written lossily instead of failing the batch
+    with open(log_file, 'a', newline='', encoding='utf-8', errors='replace') as f:
+        writer = csv.writer(f)
+        # First write of the session: an empty file still needs its header row
+        if not _HEADER_WRITTEN:
+            if f.tell() == 0:
+                writer.writerow(['timestamp', 'text', 'intent_type', 'outcome'])
+            _HEADER_WRITTEN = True
+        # Append the pending entries
+        writer.writerows(rows)
+
+def _writer() -> None:
+    """Drain the queue forever, writing each burst of rows in a single append."""
+    while True:
+        item = _queue.get()
+        rows, waiters = [], []
+        while True:
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            else:
+                rows.append(item)
+            try:
+                item = _queue.get_nowait()
+            except queue.Empty:
+                break
+        try:
+            if rows:
+                _write_rows(rows)
+        except Exception as e:
+            # Never let a bad batch end the thread: later events and flush()
+            # waiters depend on it
+            print(f"Warning: Could not write log entries: {str(e)}")
+        finally:
+            for done in waiters:
+                done.set()
+
+threading.Thread(target=_writer, name="log-writer", daemon=True).start()
+
+def flush(timeout: float = 2.0) -> None:
+    """Block until all events logged so far have been written to the CSV file."""
+    done = threading.Event()
+    _queue.put(done)
+    done.wait(timeout)
+
+atexit.register(flush)
 
 def log_event(text: str, intent_type: str, outcome: str, timestamp: Optional[datetime] = None) -> None:
     """
@@ -22,19 +85,9 @@ def log_event(text: str, intent_type: str, outcome: str, timestamp: Optional[dat
     if timestamp is None:
         timestamp = datetime.now()
 
-    # Ensure the log file exists with headers
-    log_file = Path("logs.csv")
-    if not log_file.exists():
-        with open(log_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['timestamp', 'text', 'intent_type', 'outcome'])
-    
-    # Append the new log entry
-    with open(log_file, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-            text,
-            intent_type,
-            outcome
-        ])
\ No newline at end of file
+    _queue.put([
+        timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+        text,
+        intent_type,
+        outcome
+    ])
@@ -10,7 +10,7 @@ import argparse
 import os
 import platform
 import threading
-import speech_recognition as sr
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -28,7 +28,10 @@ from . import commands
 from . import executor
 from . import state
 from . import logging_util
-from . import ui
+
+# speech_recognition is only needed for voice input; VoiceShell imports it when
+# not in --text mode (ui/Tk is likewise imported only for --ui)
+sr = None
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -72,6 +75,12 @@ def parse_args() -> argparse.Namespace:
         default=int(os.getenv("VOICE_PHRASE_LIMIT", "6")),
         help="Max seconds to capture speech (default: 6)"
     )
+    parser.add_argument(
+        "--ambient-duration",
+        type=float,
+        default=float(os.getenv("VOICE_AMBIENT_DURATION", "0.3")),
+        help="Seconds of ambient noise calibration at startup, 0 to skip (default: 0.3)"
+    )
     parser.add_argument(
         "--tts-rate",
         type=int,
@@ -91,13 +100,16 @@ def print_banner():
     print("\n".join(banner))
     print("\nSay 'help' for available commands\n")
 
-def play_beep():
-    """Play a short beep sound if available."""
-    if HAVE_WINSOUND:
+if HAVE_WINSOUND:
+    def play_beep():
+        """Play a short beep sound."""
         try:
             winsound.Beep(1000, 100)  # 1000Hz for 100ms
         except:
             pass  # Ignore any beep failures
+else:
+    def play_beep():
+        """No beep backend on this platform."""
 
 class ShellStateMachine:
     """Manages shell state and confirmation flows."""
@@ -108,6 +120,17 @@ class ShellStateMachine:
         self.pending_payload: Optional[Dict[str, Any]] = None
         self.ui = shell_ui
     
+    def _emit(self, line: str, symbol: str = ""):
+        """Print an outcome line and mirror it to the UI's outcome and history."""
+        msg = f"{symbol} {line}" if symbol else line
+        print(f"\n{msg}")
+        ui = self.ui
+        if ui:
+            # Both calls enqueue and post <<MsgQueued>>; the Tk thread applies them
+            # when it handles that event (see VoiceShellUI._post)
+            ui.update_outcome(msg)
+            ui.add_to_history(line)
+    
     def handle_delete_confirmation(self, text: str, shell_state) -> bool:
         """
         Handle yes/no confirmation for delete commands.
@@ -134,26 +157,17 @@ class ShellStateMachine:
             try:
                 executor.delete(shell_state, kind, name)
                 outcome = f"Successfully deleted {kind} '{name}'"
-                print(f"\n✅ {outcome}")
-                if self.ui:
-                    self.ui.update_outcome(f"✅ {outcome}")
-                    self.ui.add_to_history(outcome)
+                self._emit(outcome, "✅")
                 logging_util.log_event(text, "DELETE_CONFIRM", outcome)
             except Exception as e:
                 outcome = f"Error deleting {kind} '{name}': {str(e)}"
-                print(f"\n❌ {outcome}")
-                if self.ui:
-                    self.ui.update_outcome(f"❌ {outcome}")
-                    self.ui.add_to_history(outcome)
+                self._emit(outcome, "❌")
                 logging_util.log_event(text, "DELETE_CONFIRM", outcome)
                 raise
             return True
         else:
             outcome = f"Delete {payload['kind']} '{payload['name']}' cancelled."
-            print(f"\n❌ {outcome}")
-            if self.ui:
-                self.ui.update_outcome(f"❌ {outcome}")
-                self.ui.add_to_history(outcome)
+            self._emit(outcome, "❌")
             logging_util.log_event(text, "DELETE_CANCEL", outcome)
             return True
             
@@ -163,11 +177,7 @@ class ShellStateMachine:
         """Set state for delete confirmation."""
         self.state = "AWAIT_CONFIRM_DELETE"
         self.pending_payload = payload
-        prompt = f"\nConfirm delete {payload['kind']} '{payload['name']}'? Say yes/no"
-        print(prompt)
-        if self.ui:
-            self.ui.update_outcome(prompt)
-            self.ui.add_to_history(prompt)
+        self._emit(f"Confirm delete {payload['kind']} '{payload['name']}'? Say yes/no")
         logging_util.log_event(
             f"Request delete {payload['kind']} '{payload['name']}'",
             "DELETE_REQUEST",
@@ -177,19 +187,44 @@ class ShellStateMachine:
 class VoiceShell:
     """Main shell class that handles the interaction loop."""
     
+    __slots__ = (
+        'args', '_text_mode', '_listen_timeout', '_phrase_limit',
+        'running', 'listening_thread_active', 'stop_requested', 'listen_stop_event', '_beep',
+        'tts_engine', 'speech', '_recognizer', '_source', '_capture_thread', '_stt_executor',
+        'cmd_parser', 'shell_state', 'ui', 'state_machine'
+    )
+    
     def __init__(self, args):
         """Initialize shell components."""
+        global sr
         self.args = args
+        # Options read on every listen, hoisted off args
+        self._text_mode = args.text
+        self._listen_timeout = args.listen_timeout
+        self._phrase_limit = args.phrase_limit
         self.running = True
         self.listening_thread_active = False
         self.stop_requested = False
         self.listen_stop_event = threading.Event()
+        # Resolve the beep once so the listen loops skip the per-call checks
+        beep_on = HAVE_WINSOUND and not args.text and not args.no_beep
+        self._beep = play_beep if beep_on else (lambda: None)
         
         # Initialize text-to-speech
         self.tts_engine = tts.TextToSpeech(enabled=not args.no_tts, rate=args.tts_rate)
         
         # Initialize speech-to-text
-        self.speech = stt.SpeechToText(text_mode=args.text)
+        if not args.text:
+            import speech_recognition as sr
+        self.speech = stt.SpeechToText(
+            text_mode=args.text,
+            ambient_duration=args.ambient_duration,
+            skip_calibration=args.ambient_duration <= 0
+        )
+        self._recognizer = self.speech.recognizer
+        self._source = self.speech.source
+        self._capture_thread: Optional[threading.Thread] = None
+        self._stt_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt")
         
         # Initialize command parser
         self.cmd_parser = parser.CommandParser()
@@ -201,6 +236,7 @@ class VoiceShell:
         # Initialize UI if requested
         self.ui = None
         if args.ui:
+            from . import ui
             self.ui = ui.VoiceShellUI(
                 start_listening_callback=self.handle_listen_request,
                 stop_listening_callback=self.handle_stop_listening,
@@ -217,7 +253,7 @@ class VoiceShell:
     
     def handle_listen_request(self):
         """Handle one-shot listening request from UI."""
-        if self.args.text:
+        if self._text_mode:
             print("[handle_listen_request] Text mode active, ignoring voice listen.")
             return
         if self.listening_thread_active:
@@ -247,11 +283,23 @@ class VoiceShell:
         if self.ui:
             self.ui.root.quit()
     
+    def _capture_audio(self, result: list):
+        """Listen for one phrase, appending the audio or the raised error to result."""
+        try:
+            result.append(self._recognizer.listen(
+                self._source,
+                timeout=self._listen_timeout,
+                phrase_time_limit=self._phrase_limit
+            ))
+        except Exception as e:
+            result.append(e)
+
     def process_voice_input(self):
         """Process a single voice input."""
         print("[process_voice_input] Thread started.")
-        if not self.args.text and not self.args.no_beep:
-            play_beep()
+        # Speech still playing would be captured as the next command
+        self.tts_engine.wait_idle()
+        self._beep()
         
         # Check for stop request before listening
         if self.listen_stop_event.is_set():
@@ -264,53 +312,62 @@ class VoiceShell:
                 self.ui.update_outcome("❌ Listening cancelled")
             return
         
-        try:
-            with self.speech.microphone as source:
-                print("\nListening... (click Stop to cancel)")
-                audio = self.speech.recognizer.listen(
-                    source,
-                    timeout=1,  # Short timeout for frequent stop checks
-                    phrase_time_limit=self.args.phrase_limit
-                )
-        except sr.WaitTimeoutError:
-            if self.listen_stop_event.is_set():
-                # User pressed Stop
-                print("[process_voice_input] Cancelled by stop event (timeout).")
-                self.stop_requested = False
-                self.listening_thread_active = False
-                self.listen_stop_event.clear()
-                if self.ui:
-                    self.ui.set_listening(False)
-                    self.ui.update_outcome("❌ Listening cancelled")
-                return
-            print("No speech detected. Please try again.")
+        # A capture abandoned by an earlier Stop may still be reading the shared stream
+        previous = self._capture_thread
+        if previous is not None and previous.is_alive():
+            previous.join()
+
+        # Capture on its own thread with the full listen timeout; this thread only
+        # waits on the stop event, so Stop takes effect without restarting the stream
+        result = []
+        capture = threading.Thread(target=self._capture_audio, args=(result,), daemon=True)
+        self._capture_thread = capture
+        print("\nListening... (click Stop to cancel)")
+        capture.start()
+        while capture.is_alive():
+            if self.listen_stop_event.wait(0.05):
+                break
+
+        if self.listen_stop_event.is_set():
+            # User pressed Stop while listening or right after audio was captured
+            print("[process_voice_input] Cancelled by stop event.")
+            self.stop_requested = False
             self.listening_thread_active = False
+            self.listen_stop_event.clear()
             if self.ui:
                 self.ui.set_listening(False)
+                self.ui.update_outcome("❌ Listening cancelled")
             return
-        except Exception as e:
-            print(f"Listen error: {str(e)}")
+
+        audio = result[0]
+        if isinstance(audio, sr.WaitTimeoutError):
+            print("No speech detected. Please try again.")
             self.listening_thread_active = False
             if self.ui:
                 self.ui.set_listening(False)
             return
-
-        if self.listen_stop_event.is_set():
-            # Stop requested after audio captured
-            print("[process_voice_input] Cancelled by stop event (after audio).")
-            self.stop_requested = False
+        if isinstance(audio, Exception):
+            print(f"Listen error: {str(audio)}")
             self.listening_thread_active = False
-            self.listen_stop_event.clear()
             if self.ui:
                 self.ui.set_listening(False)
-                self.ui.update_outcome("❌ Listening cancelled")
             return
 
+        # Recognition (an HTTPS upload) runs on the single STT worker, which also keeps
+        # transcripts in order, while this thread frees the mic for the next listen
         print("Processing...")
+        self._stt_executor.submit(self._recognize_and_process, audio)
+        self.listening_thread_active = False
+        if self.ui:
+            self.ui.set_listening(False)
+        print("[process_voice_input] Thread finished.")
+    
+    def _recognize_and_process(self, audio):
+        """Transcribe captured audio and run the resulting command (STT worker)."""
         try:
-            text = self.speech.recognizer.recognize_google(audio)
+            text = self._recognizer.recognize_google(audio)
             print(f"You said: {text}")
-            self.process_command(text.lower())
+            self.process_command(text)
         except sr.UnknownValueError:
             print("Could not understand audio. Please try again.")
             if self.ui:
@@ -323,11 +380,6 @@ class VoiceShell:
             print(f"Error: {str(e)}")
             if self.ui:
                 self.ui.update_outcome(f"❌ Error: {str(e)}")
-        finally:
-            self.listening_thread_active = False
-            if self.ui:
-                self.ui.set_listening(False)
-            print("[process_voice_input] Thread finished.")
     
     def process_command(self, text: str):
         """Process a single command."""
@@ -352,7 +404,7 @@ class VoiceShell:
                     self.ui.update_directory(str(self.shell_state.cwd))
                 
                 # Log successful command
-                if intent["type"] != "UNKNOWN":
+                if intent.type != "UNKNOWN":
                     outcome = "Success" if not result else (
                         "Exit requested" if result[0] == "EXIT" else
                         "Delete confirmation requested"
@@ -360,7 +412,7 @@ class VoiceShell:
                     if self.ui:
                         self.ui.update_outcome(f"✅ {outcome}")
                         self.ui.add_to_history(outcome)
-                    logging_util.log_event(text, intent["type"], outcome)
+                    logging_util.log_event(text, intent.type, outcome)
                 else:
                     if self.ui:
                         self.ui.update_outcome("❌ Command not recognized")
@@ -386,7 +438,7 @@ class VoiceShell:
                 if self.ui:
                     self.ui.update_outcome(f"❌ Error: {error_msg}")
                     self.ui.add_to_history(f"Error: {error_msg}")
-                logging_util.log_event(text, intent["type"], f"Error: {error_msg}")
+                logging_util.log_event(text, intent.type, f"Error: {error_msg}")
             
         except Exception as e:
             error_msg = str(e)
@@ -434,11 +486,13 @@ class VoiceShell:
             # Main interaction loop without UI
             while self.running:
                 try:
-                    if not self.args.text and not self.args.no_beep:
-                        play_beep()
+                    if not self._text_mode:
+                        # Speech still playing would be captured as the next command
+                        self.tts_engine.wait_idle()
+                    self._beep()
                     
                     # Get input (voice or text)
-                    text = self.speech.listen_once() if not self.args.text else self.speech.read_text_input()
+                    text = self.speech.listen_once() if not self._text_mode else self.speech.read_text_input()
                     if text:
                         self.process_command(text)
                     
@@ -448,8 +502,12 @@ class VoiceShell:
                     continue
         
         # Log shutdown and cleanup
+        # Let a transcription still in flight finish before the final log flush
+        self._stt_executor.shutdown(wait=True)
         logging_util.log_event("Shell stopped", "SHUTDOWN", "Clean exit")
+        logging_util.flush()
         self.tts_engine.cleanup()
+        self.speech.close()
         print("\n👋 Goodbye!")
 
 def main():
@@ -1,255 +1,383 @@
 """
 Command parser module.
 
-This module handles the parsing of voice/text commands into structured intent
-dictionaries that can be executed by the shell. It uses regular expressions
+This module handles the parsing of voice/text commands into structured Intent
+tuples that can be executed by the shell. It uses regular expressions
 to match command patterns flexibly, allowing for natural language variations.
 """
 
 import re
-from typing import Dict, Any, List
+from collections import namedtuple
+from types import MappingProxyType
+from typing import Dict, List
+
+# Parsed command: the intent type plus whichever arguments that type uses (the rest
+# stay None). Attribute access (intent.name) replaces the old dict lookups.
+_INTENT_FIELDS = 'type name kind path app query src dst old new text count depth raw'
+Intent = namedtuple('Intent', _INTENT_FIELDS, defaults=(None,) * (len(_INTENT_FIELDS.split()) - 1))
+
+# Command patterns with named capture groups, paired with the name of the
+# CommandParser method that builds the intent. Compiled once at import and
+# matched with fullmatch against the stripped command, so they need no anchors.
+_RAW_PATTERNS = [
+    # Help command
+    (r'(?:show\s+)?(?:help|what\s+can\s+you\s+do|show\s+available\s+commands)',
+     '_handle_help'),
+
+    # Exit commands
+    (r'(?:exit|quit|goodbye|bye)',
+     '_handle_exit'),
+
+    # List files
+    (r'(?:show|list)(?:\s+all)?\s+(?:files?|contents?)|(?:show\s+me\s+the\s+contents?|what\s+files?\s+are\s+here)',
+     '_handle_list'),
+
+    # Create folder
+    (r'(?:create|make)(?:\s+a)?(?:\s+new)?\s+(?:folder|directory)(?:\s+called)?\s+(?P<name>[\w\-. ]+)',
+     '_handle_mkdir'),
+
+    # Create file
+    (r'(?:create|make)(?:\s+a)?(?:\s+new)?\s+file(?:\s+called)?\s+(?P<name>[\w\-. ]+)',
+     '_handle_mkfile'),
+
+    # Delete file/folder
+    (r'(?:delete|remove)\s+(?:the\s+)?(?P<kind>file|folder|directory)\s+(?:called\s+)?(?P<name>[\w\-. ]+)',
+     '_handle_delete'),
+
+    # Change directory (multiple forms)
+    (r'(?:change\s+directory\s+to|cd\s+to|go\s+to|move\s+to|switch\s+to\s+directory)(?:\s+folder)?\s+(?P<path>[\w\-. /\\]+)',
+     '_handle_cd'),
+    # Go back / up one directory
+    (r'(?:go\s+back|go\s+up|back)', '_handle_back'),
+
+    # Print working directory
+    (r'(?:where\s+am\s+i|show\s+(?:current\s+)?(?:working\s+)?directory|what\s+folder\s+am\s+i\s+in|current\s+location|could\s+you\s+show\s+me\s+where\s+i\s+am)',
+     '_handle_pwd'),
+
+    # Open application
+    (r'(?:open|launch|start)(?:\s+the)?\s+(?P<app>calculator|calc|notepad|paint|browser|explorer)',
+     '_handle_open_app'),
+    # Generic open file/folder by path or name
+    (r'open\s+(?P<name>[\w\-. /\\]+)', '_handle_open_file'),
+    # Search files/folders
+    (r'(?:search|find|look\s+for)\s+(?P<query>[\w\-. ]+)', '_handle_search'),
+    # Rename file/folder
+    (r'rename\s+(?P<old>[\w\-. ]+)\s+(?:to|as)\s+(?P<new>[\w\-. ]+)', '_handle_rename'),
+    # Show history with optional count
+    (r'history(?:\s+(?P<count>\d+))?', '_handle_history'),
+    # Copy file/folder
+    (r'copy\s+(?P<src>[\w\-. /\\]+)\s+(?:to|into)\s+(?P<dst>[\w\-. /\\]+)', '_handle_copy'),
+    # Move file/folder
+    (r'move\s+(?P<src>[\w\-. /\\]+)\s+(?:to|into)\s+(?P<dst>[\w\-. /\\]+)', '_handle_move'),
+    # Read file
+    (r'(?:read|show|display)\s+file\s+(?P<name>[\w\-. /\\]+)', '_handle_read'),
+    # Append to file (single or double quotes)
+    (r'(?:append|write)\s+(?P<q>["\'])(?P<text>.+?)(?P=q)\s+(?:to|into)\s+file\s+(?P<name>[\w\-. /\\]+)', '_handle_append'),
+    # Grep/search in files (single or double quotes)
+    (r'(?:grep|find\s+in\s+files|search\s+in\s+files)\s+(?P<q>["\'])(?P<query>.+?)(?P=q)', '_handle_grep'),
+    # Size of item
+    (r'(?:size\s+of|how\s+big\s+is)\s+(?P<name>[\w\-. /\\]+)', '_handle_size'),
+    # Tree view
+    (r'tree(?:\s+(?P<depth>\d+))?', '_handle_tree'),
+    # Touch file
+    (r'touch\s+(?P<name>[\w\-. /\\]+)', '_handle_touch'),
+    # Clear history
+    (r'clear\s+history', '_handle_clear_history'),
+    # Recent files
+    (r'recent\s+files(?:\s+(?P<count>\d+))?', '_handle_recents'),
+    # Stats
+    (r'stats(?:\s+here)?', '_handle_stats'),
+    # Open file
+    (r'open\s+file\s+(?P<name>[\w\-. /\\]+)', '_handle_open_file')
+]
+
+# First word(s) each handler's patterns can start with, once a polite prefix is stripped.
+# parse() tries only the rules listed under an utterance's first word and rejects any
+# other word outright, so every word a pattern can start with must appear here.
+_LEADING_WORDS = {
+    '_handle_help': ('help', 'show', 'what'),
+    '_handle_exit': ('exit', 'quit', 'goodbye', 'bye'),
+    '_handle_list': ('list', 'show', 'what'),
+    '_handle_mkdir': ('create', 'make'),
+    '_handle_mkfile': ('create', 'make'),
+    '_handle_delete': ('delete', 'remove'),
+    '_handle_cd': ('change', 'cd', 'go', 'move', 'switch'),
+    '_handle_back': ('go', 'back'),
+    '_handle_pwd': ('where', 'show', 'what', 'current', 'could'),
+    '_handle_open_app': ('open', 'launch', 'start'),
+    '_handle_open_file': ('open',),
+    '_handle_search': ('search', 'find', 'look'),
+    '_handle_rename': ('rename',),
+    '_handle_history': ('history',),
+    '_handle_copy': ('copy',),
+    '_handle_move': ('move',),
+    '_handle_read': ('read', 'show', 'display'),
+    '_handle_append': ('append', 'write'),
+    '_handle_grep': ('grep', 'find', 'search'),
+    '_handle_size': ('size', 'how'),
+    '_handle_tree': ('tree',),
+    '_handle_touch': ('touch',),
+    '_handle_clear_history': ('clear',),
+    '_handle_recents': ('recent',),
+    '_handle_stats': ('stats',),
+}
+
+def _build_combined(raw):
+    """
+    Merge the patterns into one alternation per leading word, each rule wrapped
+    in a named group r<i>.
+
+    The leading word is the first state of the grammar's automaton: it selects
+    the few rules that can match, a single match() then tries them in order
+    inside the regex engine, and match.lastgroup names the rule that fired. A
+    word with no bucket cannot start any command, so parse() rejects it without
+    running a regex. Capture groups inside rule i are renamed to r<i>_<name> so
+    rules can reuse names like 'name'; the returned rule table maps each r<i> to
+    (handler name, ((full group, short name), ...)).
+    """
+    rules = {}
+    by_word: Dict[str, List[str]] = {}
+    for i, (pattern, handler) in enumerate(raw):
+        key = f'r{i}'
+        names = re.findall(r'\(\?P<(\w+)>', pattern)
+        pattern = re.sub(r'\(\?P<(\w+)>', rf'(?P<{key}_\1>', pattern)
+        pattern = re.sub(r'\(\?P=(\w+)\)', rf'(?P={key}_\1)', pattern)
+        rules[key] = (handler, tuple((f'{key}_{n}', n) for n in names))
+        for word in _LEADING_WORDS[handler]:
+            by_word.setdefault(word, []).append(f'(?P<{key}>{pattern})')
+    # Same alternatives (and group names) in table order, restricted per word
+    buckets = {word: re.compile('|'.join(alts), re.IGNORECASE) for word, alts in by_word.items()}
+    return rules, buckets
+
+_RULES, _BUCKETS = _build_combined(_RAW_PATTERNS)
+
+# Argument-free commands in their usual spelling, answered by one dict lookup on the
+# lowercased text before any regex; other spellings still go through the patterns
+_LITERALS = {
+    'help': '_handle_help',
+    'show help': '_handle_help',
+    'what can you do': '_handle_help',
+    'exit': '_handle_exit',
+    'quit': '_handle_exit',
+    'bye': '_handle_exit',
+    'goodbye': '_handle_exit',
+    'list files': '_handle_list',
+    'show files': '_handle_list',
+    'where am i': '_handle_pwd',
+    'current location': '_handle_pwd',
+    'go back': '_handle_back',
+    'go up': '_handle_back',
+    'back': '_handle_back',
+    'history': '_handle_history',
+    'clear history': '_handle_clear_history',
+    'recent files': '_handle_recents',
+    'tree': '_handle_tree',
+    'stats': '_handle_stats',
+}
+
+# Spoken punctuation in file names ("notes dot txt"), replaced in one pass
+_SPOKEN_MAP = {
+    'dot': '.',
+    'period': '.',
+    'underscore': '_',
+    'dash': '-',
+    'slash': '/',
+    'backslash': '\\',
+}
+_SPOKEN_RE = re.compile(r'\b(' + '|'.join(_SPOKEN_MAP) + r')\b', re.IGNORECASE)
+
+# Polite prefix accepted in front of any command; stripped once in parse()
+_POLITE_RE = re.compile(r'(?:please|would\s+you\s+kindly)\s+', re.IGNORECASE)
+
+# Whitelisted applications that can be opened, by spoken name (lowercase)
+ALLOWED_APPS = MappingProxyType({
+    'calculator': 'calc',
+    'calc': 'calc',
+    'notepad': 'notepad',
+    'paint': 'mspaint',
+    'browser': 'explorer',
+    'explorer': 'explorer'
+})
+
+def _path_arg(value: str) -> str:
+    """
+    Normalize a captured file/folder name or path. Names have always been
+    lowercased (speech recognition capitalizes freely), so "read file Notes.txt"
+    must still find the notes.txt that "create file Notes.txt" made.
+    """
+    return value.strip().lower()
 
 class CommandParser:
-    def __init__(self):
-        """Initialize command patterns and whitelisted applications."""
-        # Whitelisted applications that can be opened
-        self.ALLOWED_APPS = {
-            'calculator': 'calc',
-            'calc': 'calc',
-            'notepad': 'notepad',
-            'paint': 'mspaint',
-            'browser': 'explorer',
-            'explorer': 'explorer'
-        }
-
-        # Command patterns with named capture groups
-        self.patterns = [
-            # Help command
-            (r'^\s*(?:please\s+)?(?:show\s+)?(?:help|what\s+can\s+you\s+do|show\s+available\s+commands)\s*$',
-             self._handle_help),
-            
-            # Exit commands
-            (r'^\s*(?:please\s+)?(?:exit|quit|goodbye|bye)\s*$',
-             self._handle_exit),
-            
-            # List files
-            (r'^\s*(?:please\s+)?(?:show|list)(?:\s+all)?\s+(?:files?|contents?)|(?:show\s+me\s+the\s+contents?|what\s+files?\s+are\s+here)\s*$',
-             self._handle_list),
-            
-            # Create folder
-            (r'^\s*(?:please\s+)?(?:create|make)(?:\s+a)?(?:\s+new)?\s+(?:folder|directory)(?:\s+called)?\s+(?P<name>[\w\-. ]+)\s*$',
-             self._handle_mkdir),
-            
-            # Create file
-            (r'^\s*(?:please\s+)?(?:create|make)(?:\s+a)?(?:\s+new)?\s+file(?:\s+called)?\s+(?P<name>[\w\-. ]+)\s*$',
-             self._handle_mkfile),
-            
-            # Delete file/folder
-            (r'^\s*(?:please\s+)?(?:delete|remove)\s+(?:the\s+)?(?P<kind>file|folder|directory)\s+(?:called\s+)?(?P<name>[\w\-. ]+)\s*$',
-             self._handle_delete),
-            
-            # Change directory (multiple forms)
-            (r'^\s*(?:please\s+)?(?:change\s+directory\s+to|cd\s+to|go\s+to|move\s+to|switch\s+to\s+directory)(?:\s+folder)?\s+(?P<path>[\w\-. /\\]+)\s*$',
-             self._handle_cd),
-            # Go back / up one directory
-            (r'^\s*(?:please\s+)?(?:go\s+back|go\s+up|back)\s*$', self._handle_back),
-            
-            # Print working directory
-            (r'^\s*(?:please\s+)?(?:where\s+am\s+i|show\s+(?:current\s+)?(?:working\s+)?directory|what\s+folder\s+am\s+i\s+in|current\s+location|could\s+you\s+show\s+me\s+where\s+i\s+am)\s*$',
-             self._handle_pwd),
-            
-            # Open application
-            (r'^\s*(?:please\s+|would\s+you\s+kindly\s+)?(?:open|launch|start)(?:\s+the)?\s+(?P<app>calculator|calc|notepad|paint|browser|explorer)\s*$',
-             self._handle_open_app),
-            # Generic open file/folder by path or name
-            (r'^\s*(?:please\s+)?open\s+(?P<name>[\w\-. /\\]+)\s*$', self._handle_open_file),
-            # Search files/folders
-            (r'^\s*(?:please\s+)?(?:search|find|look\s+for)\s+(?P<query>[\w\-. ]+)\s*$', self._handle_search),
-            # Rename file/folder
-            (r'^\s*(?:please\s+)?rename\s+(?P<old>[\w\-. ]+)\s+(?:to|as)\s+(?P<new>[\w\-. ]+)\s*$', self._handle_rename),
-            # Show history with optional count
-            (r'^\s*(?:please\s+)?history(?:\s+(?P<count>\d+))?\s*$', self._handle_history),
-            # Copy file/folder
-            (r'^\s*(?:please\s+)?copy\s+(?P<src>[\w\-. /\\]+)\s+(?:to|into)\s+(?P<dst>[\w\-. /\\]+)\s*$', self._handle_copy),
-            # Move file/folder
-            (r'^\s*(?:please\s+)?move\s+(?P<src>[\w\-. /\\]+)\s+(?:to|into)\s+(?P<dst>[\w\-. /\\]+)\s*$', self._handle_move),
-            # Read file
-            (r'^\s*(?:please\s+)?(?:read|show|display)\s+file\s+(?P<name>[\w\-. /\\]+)\s*$', self._handle_read),
-            # Append to file (double quotes)
-            (r'^\s*(?:please\s+)?(?:append|write)\s+"(?P<text>.+?)"\s+(?:to|into)\s+file\s+(?P<name>[\w\-. /\\]+)\s*$', self._handle_append),
-            # Append to file (single quotes)
-            (r"^\s*(?:please\s+)?(?:append|write)\s+'(?P<text>.+?)'\s+(?:to|into)\s+file\s+(?P<name>[\w\-. /\\]+)\s*$", self._handle_append),
-            # Grep/search in files (double quotes)
-            (r'^\s*(?:please\s+)?(?:grep|find\s+in\s+files|search\s+in\s+files)\s+"(?P<query>.+?)"\s*$', self._handle_grep),
-            # Grep/search in files (single quotes)
-            (r"^\s*(?:please\s+)?(?:grep|find\s+in\s+files|search\s+in\s+files)\s+'(?P<query>.+?)'\s*$", self._handle_grep),
-            # Size of item
-            (r'^\s*(?:please\s+)?(?:size\s+of|how\s+big\s+is)\s+(?P<name>[\w\-. /\\]+)\s*$', self._handle_size),
-            # Tree view
-            (r'^\s*(?:please\s+)?tree(?:\s+(?P<depth>\d+))?\s*$', self._handle_tree),
-            # Touch file
-            (r'^\s*(?:please\s+)?touch\s+(?P<name>[\w\-. /\\]+)\s*$', self._handle_touch),
-            # Clear history
-            (r'^\s*(?:please\s+)?clear\s+history\s*$', self._handle_clear_history),
-            # Recent files
-            (r'^\s*(?:please\s+)?recent\s+files(?:\s+(?P<count>\d+))?\s*$', self._handle_recents),
-            # Stats
-            (r'^\s*(?:please\s+)?stats(?:\s+here)?\s*$', self._handle_stats),
-            # Open file
-            (r'^\s*(?:please\s+)?open\s+file\s+(?P<name>[\w\-. /\\]+)\s*$', self._handle_open_file)
-        ]
+    ALLOWED_APPS = ALLOWED_APPS
+    # Leading word -> rule alternation; the handler tables are filled in below the
+    # class. All of it is shared, so a parser instance carries no state of its own.
+    __slots__ = ()
+    _verb_buckets = _BUCKETS
 
-    def parse(self, text: str) -> Dict[str, Any]:
+    def parse(self, text: str) -> Intent:
         """
-        Parse command text into an intent dictionary.
+        Parse command text into an Intent.
         
         Args:
             text: Command text to parse
             
         Returns:
-            Intent dictionary with command type and parameters
+            Intent with the command type and its parameters
         """
         if not text:
-            return {'type': 'UNKNOWN', 'raw': text}
+            return Intent('UNKNOWN', raw=text)
             
-        # Convert to lowercase for case-insensitive matching
-        text = text.lower().strip()
+        # Patterns are case-insensitive, so no lowercased copy is needed
+        text = text.strip()
         
-        # Try each pattern
-        for pattern, handler in self.patterns:
-            match = re.match(pattern, text)
-            if match:
-                return handler(match)
+        # Strip "please" / "would you kindly" once instead of in every pattern
+        polite = _POLITE_RE.match(text)
+        command = text[polite.end():] if polite else text
+
+        # Common one- and two-word commands skip the patterns entirely
+        literal = self._literals.get(command.lower())
+        if literal is not None:
+            return literal({})
+
+        # Only try the rules that can start with the leading word; no command
+        # starts with a word that has no bucket, so those need no regex at all
+        verb = command.split(None, 1)[0].lower() if command else ''
+        pattern = self._verb_buckets.get(verb)
+        # One pass over the pattern; lastgroup names the rule that matched
+        match = pattern.fullmatch(command) if pattern is not None else None
+        if match:
+            handler, names = self._dispatch[match.lastgroup]
+            return handler({short: match.group(full) for full, short in names})
         
         # Return unknown intent if no pattern matches
-        return {'type': 'UNKNOWN', 'raw': text}
+        return Intent('UNKNOWN', raw=text)
 
-    def _handle_help(self, _) -> Dict[str, str]:
+    @staticmethod
+    def _handle_help(_) -> Intent:
         """Handle help command."""
-        return {'type': 'HELP'}
+        return Intent('HELP')
 
-    def _handle_exit(self, _) -> Dict[str, str]:
+    @staticmethod
+    def _handle_exit(_) -> Intent:
         """Handle exit command."""
-        return {'type': 'EXIT'}
+        return Intent('EXIT')
 
-    def _handle_list(self, _) -> Dict[str, str]:
+    @staticmethod
+    def _handle_list(_) -> Intent:
         """Handle list files command."""
-        return {'type': 'LIST'}
+        return Intent('LIST')
 
-    def _handle_mkdir(self, match) -> Dict[str, str]:
+    @staticmethod
+    def _handle_mkdir(groups) -> Intent:
         """Handle create folder command."""
-        return {
-            'type': 'MKDIR',
-            'name': match.group('name').strip()
-        }
+        return Intent('MKDIR', name=_path_arg(groups['name']))
 
-    def _handle_mkfile(self, match) -> Dict[str, str]:
+    @staticmethod
+    def _handle_mkfile(groups) -> Intent:
         """Handle create file command."""
-        return {
-            'type': 'MKFILE',
-            'name': match.group('name').strip()
-        }
+        return Intent('MKFILE', name=_path_arg(groups['name']))
 
-    def _handle_delete(self, match) -> Dict[str, str]:
+    @staticmethod
+    def _handle_delete(groups) -> Intent:
         """Handle delete command."""
-        kind = 'folder' if match.group('kind') in ['folder', 'directory'] else 'file'
-        return {
-            'type': 'DELETE',
-            'kind': kind,
-            'name': match.group('name').strip()
-        }
-
-    def _handle_cd(self, match) -> Dict[str, str]:
+        kind = 'folder' if groups['kind'].lower() in ['folder', 'directory'] else 'file'
+        return Intent('DELETE', kind=kind, name=_path_arg(groups['name']))
+
+    @staticmethod
+    def _handle_cd(groups) -> Intent:
         """Handle change directory command."""
-        return {
-            'type': 'CD',
-            'path': match.group('path').strip()
-        }
+        return Intent('CD', path=_path_arg(groups['path']))
 
-    def _handle_back(self, _) -> Dict[str, str]:
+    @staticmethod
+    def _handle_back(_) -> Intent:
         """Handle 'go back' command."""
-        return {'type': 'CD', 'path': '..'}
+        return Intent('CD', path='..')
 
-    def _handle_pwd(self, _) -> Dict[str, str]:
+    @staticmethod
+    def _handle_pwd(_) -> Intent:
         """Handle print working directory command."""
-        return {'type': 'PWD'}
+        return Intent('PWD')
 
-    def _handle_open_app(self, match) -> Dict[str, str]:
+    @staticmethod
+    def _handle_open_app(groups) -> Intent:
         """Handle open application command."""
-        app = match.group('app').strip()
-        return {
-            'type': 'OPEN_APP',
-            'app': self.ALLOWED_APPS.get(app, app)
-        }
+        # The pattern only captures whitelisted names; it matches them in any case
+        return Intent('OPEN_APP', app=ALLOWED_APPS[groups['app'].lower()])
 
-    def _handle_search(self, match) -> Dict[str, str]:
+    @staticmethod
+    def _handle_search(groups) -> Intent:
         """Handle search files/folders command."""
-        return {'type': 'SEARCH', 'query': match.group('query').strip()}
+        return Intent('SEARCH', query=groups['query'].strip())
 
-    def _handle_rename(self, match) -> Dict[str, str]:
+    @staticmethod
+    def _handle_rename(groups) -> Intent:
         """Handle rename command."""
-        return {
-            'type': 'RENAME',
-            'old': match.group('old').strip(),
-            'new': match.group('new').strip()
-        }
+        return Intent('RENAME', old=_path_arg(groups['old']), new=_path_arg(groups['new']))
 
-    def _handle_history(self, match) -> Dict[str, Any]:
+    @staticmethod
+    def _handle_history(groups) -> Intent:
         """Handle history command with optional count."""
-        count_str = match.group('count') if 'count' in match.groupdict() else None
+        count_str = groups.get('count')
         count = int(count_str) if count_str else 10
-        return {'type': 'HISTORY', 'count': count}
+        return Intent('HISTORY', count=count)
 
-    def _handle_copy(self, match) -> Dict[str, str]:
-        return {'type': 'COPY', 'src': match.group('src').strip(), 'dst': match.group('dst').strip()}
+    @staticmethod
+    def _handle_copy(groups) -> Intent:
+        return Intent('COPY', src=_path_arg(groups['src']), dst=_path_arg(groups['dst']))
 
-    def _handle_move(self, match) -> Dict[str, str]:
-        return {'type': 'MOVE', 'src': match.group('src').strip(), 'dst': match.group('dst').strip()}
+    @staticmethod
+    def _handle_move(groups) -> Intent:
+        return Intent('MOVE', src=_path_arg(groups['src']), dst=_path_arg(groups['dst']))
 
-    def _handle_read(self, match) -> Dict[str, str]:
-        return {'type': 'READ', 'name': match.group('name').strip()}
+    @staticmethod
+    def _handle_read(groups) -> Intent:
+        return Intent('READ', name=_path_arg(groups['name']))
 
-    def _handle_append(self, match) -> Dict[str, str]:
-        text = match.group('text')
+    @staticmethod
+    def _handle_append(groups) -> Intent:
+        text = groups['text']
         if (text.startswith('"') and text.endswith('"')) or (text.startswith("'") and text.endswith("'")):
             text = text[1:-1]
-        return {'type': 'APPEND', 'name': match.group('name').strip(), 'text': text}
+        return Intent('APPEND', name=_path_arg(groups['name']), text=text)
 
-    def _handle_grep(self, match) -> Dict[str, str]:
-        return {'type': 'GREP', 'query': match.group('query').strip()}
+    @staticmethod
+    def _handle_grep(groups) -> Intent:
+        return Intent('GREP', query=groups['query'].strip())
 
-    def _handle_size(self, match) -> Dict[str, str]:
-        return {'type': 'SIZE', 'name': match.group('name').strip()}
+    @staticmethod
+    def _handle_size(groups) -> Intent:
+        return Intent('SIZE', name=_path_arg(groups['name']))
 
-    def _handle_tree(self, match) -> Dict[str, Any]:
-        depth_str = match.group('depth') if 'depth' in match.groupdict() else None
+    @staticmethod
+    def _handle_tree(groups) -> Intent:
+        depth_str = groups.get('depth')
         depth = int(depth_str) if depth_str else 2
-        return {'type': 'TREE', 'depth': depth}
+        return Intent('TREE', depth=depth)
 
-    def _handle_touch(self, match) -> Dict[str, str]:
-        return {'type': 'TOUCH', 'name': match.group('name').strip()}
+    @staticmethod
+    def _handle_touch(groups) -> Intent:
+        return Intent('TOUCH', name=_path_arg(groups['name']))
 
-    def _handle_clear_history(self, _) -> Dict[str, str]:
-        return {'type': 'CLEAR_HISTORY'}
+    @staticmethod
+    def _handle_clear_history(_) -> Intent:
+        return Intent('CLEAR_HISTORY')
 
-    def _handle_recents(self, match) -> Dict[str, Any]:
-        count_str = match.group('count') if 'count' in match.groupdict() else None
+    @staticmethod
+    def _handle_recents(groups) -> Intent:
+        count_str = groups.get('count')
         count = int(count_str) if count_str else 10
-        return {'type': 'RECENTS', 'count': count}
+        return Intent('RECENTS', count=count)
 
-    def _handle_stats(self, _) -> Dict[str, str]:
-        return {'type': 'STATS'}
+    @staticmethod
+    def _handle_stats(_) -> Intent:
+        return Intent('STATS')
 
-    def _handle_open_file(self, match) -> Dict[str, str]:
+    @staticmethod
+    def _handle_open_file(groups) -> Intent:
         # Support spoken punctuation like "dot" or "slash"
-        name = match.group('name').strip()
-        name = re.sub(r'\bdot\b', '.', name)
-        name = re.sub(r'\bperiod\b', '.', name)
-        name = re.sub(r'\bunderscore\b', '_', name)
-        name = re.sub(r'\bdash\b', '-', name)
-        name = re.sub(r'\bslash\b', '/', name)
-        name = re.sub(r'\bbackslash\b', r'\\', name)
-        return {'type': 'OPEN_FILE', 'name': name}
+        name = _path_arg(groups['name'])
+        name = _SPOKEN_RE.sub(lambda m: _SPOKEN_MAP[m.group(1).lower()], name)
+        return Intent('OPEN_FILE', name=name)
 
     def get_help(self) -> str:
         """Return help text listing available commands."""
@@ -265,4 +393,8 @@ class CommandParser:
             "- where am i (or: show working directory)",
             f"- open <app> (available: {', '.join(sorted(set(self.ALLOWED_APPS.keys())))})"
         ]
-        return "\n".join(commands)
\ No newline at end of file
+        return "\n".join(commands)
+
+# Literal text -> handler and rule -> (handler, group names), built once for all parsers
+CommandParser._literals = {text: getattr(CommandParser, h) for text, h in _LITERALS.items()}
+CommandParser._dispatch = {key: (getattr(CommandParser, h), names) for key, (h, names) in _RULES.items()}
@@ -6,10 +6,21 @@ and current working directory. It ensures all file operations remain
 within the sandbox for security.
 """
 
+import os
+import sys
 from pathlib import Path
 from typing import Optional
 
 
+def _canonical(p) -> str:
+    """
+    realpath of p as an interned string. Canonical paths recur constantly (base,
+    cwd, resolved names), so each distinct one is stored once and comparisons
+    between them hit the identity shortcut before comparing characters.
+    """
+    return sys.intern(os.path.realpath(p))
+
+
 class ShellState:
     def __init__(self, sandbox_path: Optional[str] = None):
         """
@@ -19,18 +30,38 @@ class ShellState:
         Args:
             sandbox_path: Optional path to sandbox directory
         """
-        # Get absolute path to sandbox directory
-        self.base = Path(sandbox_path or "sandbox").resolve()
+        # Get absolute path to sandbox directory; path checks below work on the
+        # canonical string and only build Path objects at the API boundary
+        self._base_str = _canonical(sandbox_path or "sandbox")
+        self.base = Path(self._base_str)
         
         # Create sandbox if it doesn't exist
         if not self.base.exists():
             self.base.mkdir(parents=True)
         elif not self.base.is_dir():
             raise RuntimeError("sandbox exists but is not a directory")
-            
+        
+        # Prefix every path below the sandbox starts with, so containment is a
+        # string comparison instead of a parents walk
+        self._base_prefix = self._base_str.rstrip(os.sep) + os.sep
+        
         # Set current working directory to sandbox root
         self.cwd = self.base
     
+    @property
+    def cwd(self) -> Path:
+        """Current working directory (always canonical)."""
+        return self._cwd
+    
+    @cwd.setter
+    def cwd(self, path) -> None:
+        self._cwd_str = sys.intern(os.fspath(path))
+        self._cwd = Path(self._cwd_str)
+    
+    def _contains(self, path_str: str) -> bool:
+        """String containment test for a canonical path."""
+        return path_str == self._base_str or path_str.startswith(self._base_prefix)
+    
     def inside_sandbox(self, target: Path) -> bool:
         """
         Check if a path is within the sandbox directory.
@@ -41,12 +72,16 @@ class ShellState:
         Returns:
             True if path is within sandbox, False otherwise
         """
+        s = os.fspath(target)
+        # Fast path: an absolute path below the canonical base is already canonical
+        # when it has no '..' and none of its components under the base is a symlink
+        if (s.startswith(self._base_prefix)
+                and self._lexical_join(self._base_str, s[len(self._base_prefix):]) is not None):
+            return True
         try:
             # Resolve any symlinks and relative path components
-            target = target.resolve()
-            # Check if target is sandbox or subdirectory of sandbox
-            return self.base in target.parents or target == self.base
-        except (RuntimeError, OSError):
+            return self._contains(os.path.realpath(s))
+        except (RuntimeError, OSError, ValueError):
             # Handle symlink loops and permission issues
             return False
     
@@ -60,21 +95,56 @@ class ShellState:
         Returns:
             Resolved absolute Path object
             
+        Raises:
+            ValueError: If path would escape sandbox
+        """
+        return Path(self.resolve_in_cwd_str(rel))
+    
+    def resolve_in_cwd_str(self, rel: str) -> str:
+        """
+        Like resolve_in_cwd, but returns the canonical path string so callers
+        that only hand it to os functions skip building a Path.
+        
         Raises:
             ValueError: If path would escape sandbox
         """
         # Handle special case for current directory
         if rel in (".", ""):
-            return self.cwd
+            return self._cwd_str
             
-        # Resolve path relative to current directory
-        target = (self.cwd / rel).resolve()
+        # Fast path: cwd is already canonical, so joining a relative path without
+        # '..' is exact as long as none of the newly added components is a symlink
+        resolved = self._lexical_join(self._cwd_str, rel)
+        if resolved is None:
+            # Resolve path relative to current directory. Never memoized: a
+            # component can be swapped for a symlink out of the sandbox at any time
+            resolved = _canonical(os.path.join(self._cwd_str, rel))
         
         # Ensure resolved path is within sandbox
-        if not self.inside_sandbox(target):
+        if not self._contains(resolved):
             raise ValueError(f"Path '{rel}' would escape sandbox")
             
-        return target
+        return resolved
+    
+    def _lexical_join(self, root: str, rel: str) -> Optional[str]:
+        """
+        Join rel onto the canonical root without resolve(), lstat-ing only the new
+        components. Returns None when a full resolve is needed: rel is absolute,
+        contains '..', or one of its components is a symlink.
+        """
+        if os.path.isabs(rel):
+            return None
+        parts = (rel.replace(os.altsep, os.sep) if os.altsep else rel).split(os.sep)
+        if os.pardir in parts:
+            return None
+        path = root
+        for part in parts:
+            if part in ('', os.curdir):
+                continue
+            path = os.path.join(path, part)
+            if os.path.islink(path):
+                return None
+        return path
     
     def change_directory(self, path: str) -> bool:
         """
@@ -86,11 +156,16 @@ class ShellState:
         Returns:
             True if directory was changed, False otherwise
         """
+        # Staying put needs no filesystem check
+        if path in ('', os.curdir):
+            return True
         try:
-            new_dir = self.resolve_in_cwd(path)
-            if not new_dir.is_dir():
+            new_str = self.resolve_in_cwd_str(path)
+            if new_str == self._cwd_str:
+                return True
+            if not os.path.isdir(new_str):
                 return False
-            self.cwd = new_dir
+            self.cwd = new_str
             return True
         except ValueError:
             return False
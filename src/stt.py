@@ -7,35 +7,80 @@ It also provides a fallback text input mode for environments where
 speech recognition is not available or not desired.
 """
 
-import speech_recognition as sr
 from typing import Optional
 
+# speech_recognition (and PortAudio behind it) is imported on first voice-mode
+# use, so text mode starts without loading it
+sr = None
+
+def _load_speech_recognition():
+    """Import speech_recognition into the module global sr and return it."""
+    global sr
+    if sr is None:
+        import speech_recognition
+        sr = speech_recognition
+    return sr
+
+# One Recognizer per process, so every SpeechToText reuses the energy threshold
+# found by the first ambient-noise calibration instead of sampling again
+_shared_recognizer = None
+_calibrated = False
+
+def _get_recognizer():
+    """Return the process-wide Recognizer, creating it on first use."""
+    global _shared_recognizer
+    if _shared_recognizer is None:
+        _shared_recognizer = _load_speech_recognition().Recognizer()
+    return _shared_recognizer
+
 
 class SpeechToText:
-    def __init__(self, text_mode: bool = False):
+    def __init__(self, text_mode: bool = False, ambient_duration: float = 0.3,
+                 skip_calibration: bool = False):
         """
         Initialize the speech recognizer and microphone.
         
+        The microphone stream is opened once here and stays open (as self.source)
+        until close(), so each listen skips the PortAudio open/close.
+        
         Args:
             text_mode: Whether to force text input mode
+            ambient_duration: Seconds of ambient noise to sample for calibration
+            skip_calibration: Keep the recognizer's default energy threshold
         """
+        global _calibrated
         self.text_mode = text_mode
-        self.recognizer = sr.Recognizer()
+        self.recognizer = None
+        self.source = None
         
         if not text_mode:
+            self.recognizer = _get_recognizer()
             try:
                 self.microphone = sr.Microphone()
-                # Adjust for ambient noise
-                with self.microphone as source:
-                    self.recognizer.adjust_for_ambient_noise(source, duration=1)
+                self.source = self.microphone.__enter__()
+                # Adjust for ambient noise (once per process; later instances
+                # inherit the threshold on the shared recognizer)
+                if not skip_calibration and not _calibrated:
+                    self.recognizer.adjust_for_ambient_noise(self.source, duration=ambient_duration)
+                    _calibrated = True
             except (OSError, sr.RequestError) as e:
                 print(f"Warning: Could not initialize microphone: {str(e)}")
                 print("Falling back to text input mode.")
+                self.close()
                 self.microphone = None
                 self.text_mode = True
         else:
             self.microphone = None
 
+    def close(self) -> None:
+        """Close the microphone stream opened in __init__, if any."""
+        if self.source is not None:
+            try:
+                self.microphone.__exit__(None, None, None)
+            except Exception:
+                pass
+            self.source = None
+
     def listen_once(self, timeout: int = 5, phrase_time_limit: int = 6) -> str:
         """
         Listen for a single voice command and convert it to text.
@@ -47,22 +92,21 @@ class SpeechToText:
         Returns:
             Recognized text or empty string if recognition fails
         """
-        if self.text_mode or not self.microphone:
+        if self.text_mode or self.source is None:
             return self.read_text_input()
             
         try:
-            with self.microphone as source:
-                print("\nListening...")
-                audio = self.recognizer.listen(
-                    source,
-                    timeout=timeout,
-                    phrase_time_limit=phrase_time_limit
-                )
+            print("\nListening...")
+            audio = self.recognizer.listen(
+                self.source,
+                timeout=timeout,
+                phrase_time_limit=phrase_time_limit
+            )
                 
             print("Processing...")
             text = self.recognizer.recognize_google(audio)
             print(f"You said: {text}")
-            return text.lower()
+            return text
             
         except sr.WaitTimeoutError:
             print("No speech detected. Please try again.")
@@ -82,10 +126,9 @@ class SpeechToText:
         Read command from keyboard input as a fallback method.
         
         Returns:
-            The entered text command in lowercase
+            The entered text command
         """
         try:
-            text = input("\nEnter command: ").strip()
-            return text.lower()
+            return input("\nEnter command: ").strip()
         except (KeyboardInterrupt, EOFError):
             return ""
\ No newline at end of file
@@ -4,64 +4,116 @@ Text-to-speech conversion module.
 This module handles the conversion of text responses to speech
 using the pyttsx3 library for offline text-to-speech synthesis.
 TTS can be globally enabled/disabled via initialization.
+
+Speech runs on a background worker thread that owns the engine, so say()
+returns as soon as the text is queued instead of waiting for playback.
 """
 
-import pyttsx3
+import queue
+import threading
 from typing import Optional
 
 class TextToSpeech:
+    # Installed voices, enumerated once per process (slow on SAPI5) and reused by
+    # every engine created afterwards
+    _voices_cache = None
+
     def __init__(self, enabled: bool = True, rate: Optional[int] = None, volume: Optional[float] = None):
         """
         Initialize the TTS engine.
-        
+
         Args:
             enabled: Whether TTS should be enabled
         """
         self.enabled = enabled
         self.engine = None
-        
+        # Texts waiting to be spoken; None tells the worker to stop
+        self._q: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._worker_thread: Optional[threading.Thread] = None
+
         if enabled:
+            # Some pyttsx3 drivers (SAPI5) are bound to the thread that created the
+            # engine, so the worker creates it; wait here so a failure is reported now
+            ready = threading.Event()
+            self._worker_thread = threading.Thread(
+                target=self._worker, args=(rate, volume, ready), daemon=True)
+            self._worker_thread.start()
+            ready.wait()
+
+    def _init_engine(self, rate: Optional[int], volume: Optional[float]) -> None:
+        """Create and configure the pyttsx3 engine (worker thread)."""
+        try:
+            # Imported here so --no-tts never loads pyttsx3 or its driver
+            import pyttsx3
+            engine = pyttsx3.init()
+            # Set properties (allow overrides)
+            default_rate = 150 if rate is None else rate
+            default_volume = 0.9 if volume is None else volume
+            engine.setProperty('rate', default_rate)    # Speaking rate
+            engine.setProperty('volume', default_volume)  # Volume (0.0 to 1.0)
+
+            # Try to set a female voice if available
+            if TextToSpeech._voices_cache is None:
+                TextToSpeech._voices_cache = engine.getProperty('voices')
+            female = next((v for v in TextToSpeech._voices_cache if 'female' in v.name.lower()), None)
+            if female is not None:
+                engine.setProperty('voice', female.id)
+            self.engine = engine
+        except Exception as e:
+            print(f"Warning: Could not initialize TTS engine: {str(e)}")
+            print("TTS feedback will be disabled.")
+            self.engine = None
+
+    def _worker(self, rate: Optional[int], volume: Optional[float], ready: threading.Event) -> None:
+        """Own the engine and speak queued texts in order until the stop sentinel."""
+        try:
+            self._init_engine(rate, volume)
+        finally:
+            ready.set()
+        engine = self.engine
+        if engine is None:
+            return
+        while True:
+            text = self._q.get()
+            if text is None:
+                self._q.task_done()
+                break
             try:
-                self.engine = pyttsx3.init()
-                # Set properties (allow overrides)
-                default_rate = 150 if rate is None else rate
-                default_volume = 0.9 if volume is None else volume
-                self.engine.setProperty('rate', default_rate)    # Speaking rate
-                self.engine.setProperty('volume', default_volume)  # Volume (0.0 to 1.0)
-                
-                # Try to set a female voice if available
-                voices = self.engine.getProperty('voices')
-                for voice in voices:
-                    if 'female' in voice.name.lower():
-                        self.engine.setProperty('voice', voice.id)
-                        break
+                engine.say(text)
+                engine.runAndWait()
             except Exception as e:
-                print(f"Warning: Could not initialize TTS engine: {str(e)}")
-                print("TTS feedback will be disabled.")
-                self.engine = None
+                print(f"TTS Error: {str(e)}")
+            finally:
+                self._q.task_done()
+        try:
+            engine.stop()
+        except:
+            pass
 
     def say(self, text: str) -> None:
         """
         Convert text to speech if TTS is enabled.
-        
+
         Args:
             text: The text to be spoken
         """
         # Print the text regardless of TTS state
         print(text)
-        
-        # Only attempt speech if TTS is enabled and engine is initialized
+
+        # Only queue speech if TTS is enabled and engine is initialized
         if self.enabled and self.engine is not None:
-            try:
-                self.engine.say(text)
-                self.engine.runAndWait()
-            except Exception as e:
-                print(f"TTS Error: {str(e)}")
+            self._q.put(text)
 
-    def cleanup(self) -> None:
-        """Clean up TTS engine resources."""
-        if self.engine is not None:
-            try:
-                self.engine.stop()
-            except:
-                pass
\ No newline at end of file
+    def wait_idle(self) -> None:
+        """
+        Block until everything queued so far has been spoken, so a microphone
+        opened next does not pick up the shell's own voice.
+        """
+        if self._worker_thread is not None and self._worker_thread.is_alive():
+            self._q.join()
+
+    def cleanup(self, timeout: float = 5.0) -> None:
+        """Finish queued speech (up to timeout seconds) and release the engine."""
+        if self._worker_thread is not None and self._worker_thread.is_alive():
+            self._q.put(None)
+            self._worker_thread.join(timeout)
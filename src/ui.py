@@ -5,6 +5,13 @@ import queue
 import threading
 
 class VoiceShellUI:
+    # Message type -> (line in info_text, fixed prefix before the value)
+    _INFO_LINES = {
+        "dir": (1, "Directory: "),
+        "cmd": (2, "Command: "),
+        "outcome": (3, "Outcome: "),
+    }
+    
     def __init__(self, start_listening_callback: Callable, 
                  stop_listening_callback: Callable,
                  exit_callback: Callable,
@@ -21,27 +28,30 @@ class VoiceShellUI:
         
         # Message queue for thread-safe UI updates
         self.msg_queue = queue.Queue()
+        # Set while a debounced submit is scheduled
+        self._submit_pending = False
         
         self._create_widgets()
         self._setup_layout()
         
-        # Start message processing
-        self.root.after(100, self._process_messages)
+        # Producers signal queued messages with a virtual event, so the queue is
+        # drained as soon as Tk is idle instead of on a polling timer
+        self.root.bind('<<MsgQueued>>', lambda e: self._process_messages())
         # Initialize button states
         self.set_listening(False)
     
     def _create_widgets(self):
-        # Current directory frame
-        self.dir_frame = ttk.LabelFrame(self.root, text="Current Directory")
-        self.dir_label = ttk.Label(self.dir_frame, text="", wraplength=550)
-        
-        # Last command frame
-        self.cmd_frame = ttk.LabelFrame(self.root, text="Last Command")
-        self.cmd_label = ttk.Label(self.cmd_frame, text="", wraplength=550)
-        
-        # Last outcome frame
-        self.outcome_frame = ttk.LabelFrame(self.root, text="Last Outcome")
-        self.outcome_label = ttk.Label(self.outcome_frame, text="", wraplength=550)
+        # Current directory, last command and last outcome, one line each in a
+        # single read-only Text: replacing a line there is cheaper than having a
+        # wraplength Label re-measure its whole text on every update. No wrapping,
+        # so each field is exactly one display line and all three stay in view
+        # (a long path is clipped at the right edge instead of hiding Outcome)
+        self.info_frame = ttk.LabelFrame(self.root, text="Status")
+        self.info_text = tk.Text(
+            self.info_frame, wrap=tk.NONE, height=3, relief=tk.FLAT,
+            background=self.root.cget("background"))
+        self.info_text.insert("1.0", "".join(prefix + "\n" for _, prefix in self._INFO_LINES.values()))
+        self.info_text.config(state=tk.DISABLED)
         
         # History pane
         self.history_frame = ttk.LabelFrame(self.root, text="History")
@@ -75,14 +85,8 @@ class VoiceShellUI:
     
     def _setup_layout(self):
         # Pack main sections
-        self.dir_frame.pack(fill=tk.X, padx=5, pady=2)
-        self.dir_label.pack(fill=tk.X, padx=5, pady=2)
-        
-        self.cmd_frame.pack(fill=tk.X, padx=5, pady=2)
-        self.cmd_label.pack(fill=tk.X, padx=5, pady=2)
-        
-        self.outcome_frame.pack(fill=tk.X, padx=5, pady=2)
-        self.outcome_label.pack(fill=tk.X, padx=5, pady=2)
+        self.info_frame.pack(fill=tk.X, padx=5, pady=2)
+        self.info_text.pack(fill=tk.X, padx=5, pady=2)
         
         self.history_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=2)
         self.history_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=2)
@@ -104,6 +108,14 @@ class VoiceShellUI:
         # self.progress.pack(side=tk.RIGHT)  # removed
     
     def _on_submit(self):
+        # Debounce: key-repeat on Return or a double-click within 150 ms submits once
+        if self._submit_pending:
+            return
+        self._submit_pending = True
+        self.root.after(150, self._do_submit)
+    
+    def _do_submit(self):
+        self._submit_pending = False
         text = self.input_entry.get().strip()
         if text:
             self.input_entry.delete(0, tk.END)
@@ -111,39 +123,73 @@ class VoiceShellUI:
     
     def _process_messages(self):
         """Process messages from the queue and update UI"""
+        # Drain everything first: labels only need their latest value, and all
+        # history lines go in with one insert, so each drain makes O(1) widget calls
+        last_dir = last_cmd = last_outcome = None
+        history_buf = []
         try:
             while True:
                 msg_type, msg = self.msg_queue.get_nowait()
                 if msg_type == "dir":
-                    self.dir_label.config(text=msg)
+                    last_dir = msg
                 elif msg_type == "cmd":
-                    self.cmd_label.config(text=msg)
+                    last_cmd = msg
                 elif msg_type == "outcome":
-                    self.outcome_label.config(text=msg)
+                    last_outcome = msg
                 elif msg_type == "history":
-                    self.history_text.config(state=tk.NORMAL)
-                    self.history_text.insert(tk.END, msg + "\n")
-                    self.history_text.see(tk.END)
-                    self.history_text.config(state=tk.DISABLED)
+                    history_buf.append(msg)
         except queue.Empty:
             pass
-        self.root.after(100, self._process_messages)
+        info = [(kind, value) for kind, value in
+                (("dir", last_dir), ("cmd", last_cmd), ("outcome", last_outcome))
+                if value is not None]
+        if info:
+            self.info_text.config(state=tk.NORMAL)
+            for kind, value in info:
+                line, prefix = self._INFO_LINES[kind]
+                start = f"{line}.{len(prefix)}"
+                self.info_text.delete(start, f"{line}.end")
+                self.info_text.insert(start, value.strip().replace("\n", " "))
+            self.info_text.config(state=tk.DISABLED)
+        if history_buf:
+            self.history_text.config(state=tk.NORMAL)
+            self.history_text.insert(tk.END, "\n".join(history_buf) + "\n")
+            self.history_text.see(tk.END)
+            self.history_text.config(state=tk.DISABLED)
+    
+    def _post(self, msg_type: str, msg: str):
+        """
+        Queue a UI update and wake the Tk thread to apply it.
+
+        Called from the listen and STT worker threads as well as the Tk thread.
+        Calling event_generate off the Tk thread relies on a threaded Tcl build
+        (the default for python.org and distro builds): tkinter then hands the
+        call to the thread running mainloop instead of touching Tk directly.
+        Once mainloop has exited that hand-off raises RuntimeError, and a
+        destroyed window raises TclError; both mean nobody is left to update,
+        so the message is dropped silently.
+        """
+        self.msg_queue.put((msg_type, msg))
+        try:
+            self.root.event_generate('<<MsgQueued>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            pass
     
     def update_directory(self, directory: str):
         """Update current directory display"""
-        self.msg_queue.put(("dir", directory))
+        self._post("dir", directory)
     
     def update_command(self, command: str):
         """Update last command display"""
-        self.msg_queue.put(("cmd", command))
+        self._post("cmd", command)
     
     def update_outcome(self, outcome: str):
         """Update last outcome display"""
-        self.msg_queue.put(("outcome", outcome))
+        self._post("outcome", outcome)
     
     def add_to_history(self, text: str):
         """Add a new entry to history"""
-        self.msg_queue.put(("history", text))
+        self._post("history", text)
 
     def set_mode_status(self, text: str):
         """Update status label with mode/config"""
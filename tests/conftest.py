@@ -0,0 +1,50 @@
+"""
+Shared fixtures: a sandbox directory tree with ways out of it.
+"""
+
+import pytest
+
+# Paths relative to the sandbox root that all lead outside it
+ESCAPES = [
+    "out",
+    "out/secret.txt",
+    "a/out",
+    "a/out/secret.txt",
+    "a/b/../out",
+    "sib",
+    "sib/secret.txt",
+    "..",
+    "../outside",
+    "a/../../sbx2",
+    "../sbx2/secret.txt",
+    "a/b/../../../outside/secret.txt",
+]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """
+    tmp/
+      outside/secret.txt
+      sbx2/secret.txt
+      sbx/a/b/            plain nested folders
+      sbx/a/out -> outside   (nested symlink out)
+      sbx/a/in -> sbx/c      (symlink that stays inside)
+      sbx/c/
+      sbx/out -> outside     (top-level symlink out)
+      sbx/sib -> sbx2        (symlink to the prefix sibling)
+    """
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "secret.txt").write_text("secret")
+    sibling = tmp_path / "sbx2"
+    sibling.mkdir()
+    (sibling / "secret.txt").write_text("secret")
+    base = tmp_path / "sbx"
+    (base / "a" / "b").mkdir(parents=True)
+    (base / "c").mkdir()
+    (base / "a" / "out").symlink_to(outside)
+    (base / "a" / "in").symlink_to(base / "c")
+    (base / "out").symlink_to(outside)
+    (base / "sib").symlink_to(sibling)
+    return tmp_path
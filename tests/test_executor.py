@@ -0,0 +1,189 @@
+"""
+Test suite for the command executor.
+
+Covers history tailing and the sandbox checks on file operations.
+"""
+
+import csv
+import os
+import threading
+
+import pytest
+
+from src import executor
+from src.state import ShellState
+from tests.conftest import ESCAPES
+
+FIELDS = ["timestamp", "text", "intent_type", "outcome"]
+
+
+def write_log(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        writer.writerows(rows)
+
+
+def history_rows(n, outcome="success"):
+    return [[f"2024-01-01 00:00:{i:02d}", f"cmd {i}", "LIST", outcome] for i in range(n)]
+
+
+@pytest.fixture
+def state(tmp_path):
+    return ShellState(str(tmp_path / "sb"))
+
+
+@pytest.fixture
+def boxed(tree):
+    """ShellState over the conftest tree, whose sandbox has symlinks leading out."""
+    return ShellState(str(tree / "sbx"))
+
+
+def outside_untouched(tree):
+    return ((tree / "outside" / "secret.txt").read_text() == "secret"
+            and (tree / "sbx2" / "secret.txt").read_text() == "secret")
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+# History
+
+def test_read_history_returns_last_entries(log_dir):
+    write_log(log_dir / "logs.csv", history_rows(30))
+    entries = executor.read_history(3)
+    assert [e["text"] for e in entries] == ["cmd 27", "cmd 28", "cmd 29"]
+
+
+def test_read_history_keeps_multiline_outcome(log_dir):
+    rows = history_rows(3)
+    rows[-1][3] = "Error: line1\nline2"
+    write_log(log_dir / "logs.csv", rows)
+    entries = executor.read_history(2)
+    assert [e["outcome"] for e in entries] == ["success", "Error: line1\nline2"]
+
+
+def test_read_history_window_cut_mid_record(log_dir, monkeypatch):
+    monkeypatch.setattr(executor, "_TAIL_BLOCK_SIZE", 16)
+    rows = history_rows(4)
+    rows[1][3] = "\n".join(f"line {i}, with comma" for i in range(20))
+    rows[2][1] = "say\u2028hi\x0b"
+    write_log(log_dir / "logs.csv", rows)
+    entries = executor.read_history(2)
+    assert [e["text"] for e in entries] == ["say\u2028hi\x0b", "cmd 3"]
+    entries = executor.read_history(3)
+    assert entries[0]["outcome"] == rows[1][3]
+    assert [e["text"] for e in executor.read_history(10)] == [r[1] for r in rows]
+
+
+# Copy
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs named pipes")
+def test_copy_folder_with_fifo_does_not_hang(state):
+    src = state.base / "src"
+    src.mkdir()
+    (src / "a.txt").write_text("hello")
+    os.mkfifo(src / "pipe")
+    result = []
+    worker = threading.Thread(
+        target=lambda: result.append(executor.copy_item(state, "src", "dst")), daemon=True)
+    worker.start()
+    worker.join(5)
+    assert not worker.is_alive()
+    assert result[0].startswith("Error:")
+    assert "named pipe" in result[0]
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="needs copy_file_range")
+def test_copy_falls_back_when_copy_file_range_stops_early(state, monkeypatch):
+    (state.base / "a.txt").write_bytes(b"x" * 5000)
+    monkeypatch.setattr(executor.os, "copy_file_range", lambda *args: 0)
+    assert executor.copy_item(state, "a.txt", "b.txt").startswith("Copied")
+    assert (state.base / "b.txt").read_bytes() == b"x" * 5000
+
+
+# Path resolution
+
+def test_ops_recheck_a_previously_resolved_path(state, tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "f.txt").write_text("secret")
+    (state.base / "d").mkdir()
+    (state.base / "d" / "f.txt").write_text("inside")
+    assert executor.read_file(state, "d/../d/f.txt")[1] == ["inside"]
+
+    # Swap the directory for a symlink out of the sandbox behind the shell's back
+    (state.base / "d" / "f.txt").unlink()
+    (state.base / "d").rmdir()
+    (state.base / "d").symlink_to(outside)
+
+    assert executor.read_file(state, "d/../d/f.txt")[0].startswith("Error")
+    assert executor.item_size(state, "d/../d/f.txt").startswith("Error")
+    assert executor.append_file(state, "d/../d/f.txt", "x").startswith("Error")
+    assert executor.touch_file(state, "d/../d/f.txt").startswith("Error")
+    assert (outside / "f.txt").read_text() == "secret"
+
+
+# Sandbox
+
+@pytest.mark.parametrize("rel", ESCAPES)
+def test_cd_cannot_leave_sandbox(boxed, rel, capsys):
+    executor.cd(boxed, rel)
+    assert "Error" in capsys.readouterr().out
+    assert boxed.cwd == boxed.base
+
+
+@pytest.mark.parametrize("rel", ESCAPES)
+def test_read_cannot_leave_sandbox(boxed, rel):
+    outcome, lines = executor.read_file(boxed, rel)
+    assert outcome.startswith("Error")
+    assert lines == []
+
+
+@pytest.mark.parametrize("kind", ["file", "folder"])
+@pytest.mark.parametrize("rel", ESCAPES)
+def test_delete_cannot_leave_sandbox(boxed, tree, rel, kind, capsys):
+    executor.delete(boxed, kind, rel)
+    assert "Error" in capsys.readouterr().out
+    assert outside_untouched(tree)
+    assert (tree / "sbx" / "a" / "out").is_symlink()
+
+
+def test_cd_read_delete_inside_sandbox(boxed, tree):
+    (tree / "sbx" / "c" / "notes.txt").write_text("hello\nworld")
+    executor.cd(boxed, "a/in")
+    assert boxed.cwd == boxed.base / "c"
+    assert executor.read_file(boxed, "notes.txt")[1] == ["hello", "world"]
+    executor.cd(boxed, "..")
+    assert boxed.cwd == boxed.base
+    assert executor.read_file(boxed, "a/b/../in/notes.txt")[1] == ["hello", "world"]
+    executor.delete(boxed, "file", "a/in/notes.txt")
+    assert not (tree / "sbx" / "c" / "notes.txt").exists()
+    executor.delete(boxed, "folder", "a/b")
+    assert not (tree / "sbx" / "a" / "b").exists()
+    assert outside_untouched(tree)
+
+
+# Size
+
+def test_size_sees_nested_file_growth(state):
+    nested = state.base / "a" / "b"
+    nested.mkdir(parents=True)
+    (nested / "f.txt").write_bytes(b"x" * 10)
+    assert executor.item_size(state, "a") == "Size of 'a': 10.00 B"
+    with open(nested / "f.txt", "ab") as f:
+        f.write(b"x" * 20)
+    assert executor.item_size(state, "a") == "Size of 'a': 30.00 B"
+
+
+# Read
+
+def test_read_splits_on_line_endings_only(state):
+    (state.base / "f.txt").write_text(
+        "col1\x0ccol2\r\nnext\x1dline\u2028end\n", encoding="utf-8", newline="")
+    outcome, lines = executor.read_file(state, "f.txt")
+    assert lines == ["col1\x0ccol2", "next\x1dline\u2028end"]
+    assert outcome == "Read 2 lines from 'f.txt'"
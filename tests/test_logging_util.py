@@ -0,0 +1,25 @@
+"""
+Test suite for the CSV event logger.
+"""
+
+import csv
+import time
+
+from src import logging_util
+
+
+def test_unencodable_row_does_not_stop_writer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(logging_util, "_HEADER_WRITTEN", False)
+
+    logging_util.log_event("bad \udcff name", "READ", "success")
+    logging_util.flush()
+    logging_util.log_event("list files", "LIST", "success")
+    start = time.monotonic()
+    logging_util.flush()
+    assert time.monotonic() - start < 1.0
+
+    with open(tmp_path / "logs.csv", newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["timestamp", "text", "intent_type", "outcome"]
+    assert rows[-1][1:] == ["list files", "LIST", "success"]
@@ -0,0 +1,116 @@
+"""
+Test suite for the sandbox checks in ShellState.
+
+Tests run against the "tree" fixture from conftest.py: a sandbox "sbx" next
+to a sibling "sbx2" (same string prefix) and an "outside" directory, with
+symlinks leading out of the sandbox.
+"""
+
+import os
+
+import pytest
+
+from src.state import ShellState
+from tests.conftest import ESCAPES
+
+
+@pytest.fixture
+def state(tree):
+    return ShellState(str(tree / "sbx"))
+
+
+INSIDE = [
+    ("a", "a"),
+    ("a/b", os.path.join("a", "b")),
+    ("a/b/../b", os.path.join("a", "b")),
+    ("a/./b/", os.path.join("a", "b")),
+    ("a/in", "c"),
+    ("a/in/new.txt", os.path.join("c", "new.txt")),
+    ("a/new/deeper.txt", os.path.join("a", "new", "deeper.txt")),
+    ("missing.txt", "missing.txt"),
+]
+
+
+# inside_sandbox
+
+def test_inside_sandbox_accepts_base_and_children(state):
+    base = str(state.base)
+    assert state.inside_sandbox(state.base)
+    assert state.inside_sandbox(base)
+    assert state.inside_sandbox(os.path.join(base, "a", "b"))
+    assert state.inside_sandbox(os.path.join(base, "a", "b", "..", "b"))
+    assert state.inside_sandbox(os.path.join(base, "a", "in"))
+    assert state.inside_sandbox(os.path.join(base, "not", "there.txt"))
+
+
+@pytest.mark.parametrize("rel", ESCAPES)
+def test_inside_sandbox_rejects_escapes(state, rel):
+    assert not state.inside_sandbox(os.path.join(str(state.base), rel))
+
+
+def test_inside_sandbox_rejects_absolute_outside_paths(state, tree):
+    assert not state.inside_sandbox(tree / "outside" / "secret.txt")
+    assert not state.inside_sandbox(str(tree))
+    assert not state.inside_sandbox(os.sep)
+
+
+def test_inside_sandbox_rejects_prefix_sibling(state, tree):
+    assert not state.inside_sandbox(tree / "sbx2")
+    assert not state.inside_sandbox(str(tree / "sbx2" / "secret.txt"))
+    assert not state.inside_sandbox(str(state.base) + "2")
+
+
+# resolve_in_cwd
+
+@pytest.mark.parametrize("rel, expected", INSIDE)
+def test_resolve_in_cwd_inside(state, rel, expected):
+    assert state.resolve_in_cwd_str(rel) == os.path.join(str(state.base), expected)
+    assert state.resolve_in_cwd(rel) == state.base / expected
+
+
+@pytest.mark.parametrize("rel", ESCAPES)
+def test_resolve_in_cwd_rejects_escapes(state, rel):
+    with pytest.raises(ValueError):
+        state.resolve_in_cwd_str(rel)
+
+
+def test_resolve_in_cwd_rejects_absolute_paths(state, tree):
+    with pytest.raises(ValueError):
+        state.resolve_in_cwd_str(str(tree / "outside" / "secret.txt"))
+    with pytest.raises(ValueError):
+        state.resolve_in_cwd_str(str(tree / "sbx2"))
+    assert state.resolve_in_cwd_str(str(state.base / "a")) == str(state.base / "a")
+
+
+def test_resolve_in_cwd_after_symlink_swap(state, tree):
+    # A '..' path resolved once is re-checked after its directory is
+    # swapped for a symlink out of the sandbox
+    assert state.resolve_in_cwd_str("a/b/../b") == str(state.base / "a" / "b")
+    os.rmdir(state.base / "a" / "b")
+    (state.base / "a" / "b").symlink_to(tree / "outside")
+    with pytest.raises(ValueError):
+        state.resolve_in_cwd_str("a/b/../b")
+    with pytest.raises(ValueError):
+        state.resolve_in_cwd_str("a/b/secret.txt")
+
+
+# change_directory
+
+@pytest.mark.parametrize("rel", ESCAPES)
+def test_change_directory_rejects_escapes(state, rel):
+    assert not state.change_directory(rel)
+    assert state.cwd == state.base
+
+
+def test_change_directory_moves_within_sandbox(state):
+    assert state.change_directory("a/b")
+    assert state.cwd == state.base / "a" / "b"
+    assert state.change_directory(".")
+    assert state.cwd == state.base / "a" / "b"
+    assert not state.change_directory("../../..")
+    assert state.change_directory("../..")
+    assert state.cwd == state.base
+    assert state.change_directory("a/in")
+    assert state.cwd == state.base / "c"
+    assert not state.change_directory("missing")
+    assert state.cwd == state.base / "c"